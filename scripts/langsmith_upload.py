@@ -17,15 +17,21 @@ from __future__ import annotations
 import json
 import os
 import pathlib
+import re
 import sys
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except Exception as e:
     print("This script requires the 'requests' package. Install with: pip install requests")
     raise
 
 
+_TR_UUID_RE = re.compile(r"tr_uuid=([0-9a-fA-F\-]+)")
+
+
 def main(argv: list[str]) -> int:
     api_key = os.environ.get("LANGSMITH_API_KEY")
     if not api_key:
@@ -56,11 +62,18 @@ def main(argv: list[str]) -> int:
     }
 
     print("Posting report to LangSmith endpoint:", endpoint)
+    # Creating a run is not idempotent: retry only failed connects, where nothing was sent.
+    retry = Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5)
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    session.mount("http://", HTTPAdapter(max_retries=retry))
     try:
-        resp = requests.post(endpoint, headers=headers, json=payload, timeout=30)
+        resp = session.post(endpoint, headers=headers, json=payload, timeout=30)
     except Exception as e:
         print("Network error while contacting LangSmith:", e)
         return 4
+    finally:
+        session.close()
 
     print("HTTP status:", resp.status_code)
     # Prefer JSON output when available
@@ -76,9 +89,7 @@ def main(argv: list[str]) -> int:
         text = resp.text
         print(text)
         # Try to extract a tr_uuid from HTML redirect links if present
-        import re
-
-        m = re.search(r"tr_uuid=([0-9a-fA-F\-]+)", text)
+        m = _TR_UUID_RE.search(text)
         if m:
             tr = m.group(1)
             run_url = f"https://api.langsmith.ai/v1/runs?tr_uuid={tr}"
@@ -1,56 +1,35 @@
 from __future__ import annotations
 
-import json
 import os
-import subprocess
+import re
 from pathlib import Path
 
+import httpx
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional runtime dependency fallback
+    orjson = None
+
+_ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
 
 def load_env(path: str = ".env") -> None:
     p = Path(path)
     if not p.exists():
         return
-    for line in p.read_text(encoding="utf-8").splitlines():
-        s = line.strip()
-        if not s or s.startswith("#") or "=" not in s:
-            continue
-        key, value = s.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        os.environ.setdefault(key, value)
-
-
-def request_json(url: str, api_key: str, method: str = "GET", payload: dict | None = None):
-    command = [
-        "curl",
-        "-sS",
-        "-X",
-        method,
-        "-H",
-        f"x-api-key: {api_key}",
-        "-H",
-        "Accept: application/json",
-        "-H",
-        "Content-Type: application/json",
-        "-w",
-        "\n%{http_code}",
-        url,
-    ]
-    if payload is not None:
-        command.extend(["-d", json.dumps(payload)])
-
-    proc = subprocess.run(command, capture_output=True, text=True)
-    if proc.returncode != 0:
-        raise RuntimeError(proc.stderr.strip() or "curl failed")
-
-    output = proc.stdout
-    if "\n" not in output:
-        raise RuntimeError("unexpected curl output")
-    body, status_text = output.rsplit("\n", 1)
-    status = int(status_text.strip())
-    if status >= 400:
-        raise RuntimeError(f"HTTP {status}: {body[:200]}")
-    return json.loads(body)
+    for match in _ENV_LINE_RE.finditer(p.read_text(encoding="utf-8")):
+        value = match.group(2).strip('"').strip("'")
+        os.environ.setdefault(match.group(1), value)
+
+
+def request_json(client: httpx.Client, url: str, method: str = "GET", payload: dict | None = None):
+    resp = client.request(method, url, json=payload)
+    if resp.status_code >= 400:
+        raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:200]}")
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
 
 
 def main() -> int:
@@ -63,39 +42,44 @@ def main() -> int:
         print("LANGSMITH_API_KEY missing. Set it in .env or your shell.")
         return 1
 
-    try:
-        sessions_url = f"{endpoint}/api/v1/sessions?limit=100"
-        sessions = request_json(sessions_url, api_key)
-    except Exception as exc:
-        print(f"Unable to reach LangSmith API: {exc}")
-        return 1
-
-    if not isinstance(sessions, list) or not sessions:
-        print("No LangSmith sessions/projects found for this key.")
-        return 1
-
-    session = None
-    if project:
-        for candidate in sessions:
-            if candidate.get("name") == project:
-                session = candidate
-                break
-    if session is None:
-        session = sessions[0]
-
-    session_id = session.get("id")
-    session_name = session.get("name", "<unnamed>")
-    if not session_id:
-        print("Unable to resolve a valid session id.")
-        return 1
-
-    try:
-        runs_url = f"{endpoint}/api/v1/runs/query"
-        runs_payload = {"session": [session_id], "limit": 5}
-        runs = request_json(runs_url, api_key, method="POST", payload=runs_payload)
-    except Exception as exc:
-        print(f"Unable to query runs: {exc}")
-        return 1
+    # One pooled client so the sessions and runs queries share a keep-alive connection.
+    with httpx.Client(
+        timeout=30,
+        headers={"x-api-key": api_key, "Accept": "application/json"},
+    ) as client:
+        try:
+            sessions_url = f"{endpoint}/api/v1/sessions?limit=100"
+            sessions = request_json(client, sessions_url)
+        except Exception as exc:
+            print(f"Unable to reach LangSmith API: {exc}")
+            return 1
+
+        if not isinstance(sessions, list) or not sessions:
+            print("No LangSmith sessions/projects found for this key.")
+            return 1
+
+        session = None
+        if project:
+            for candidate in sessions:
+                if candidate.get("name") == project:
+                    session = candidate
+                    break
+        if session is None:
+            session = sessions[0]
+
+        session_id = session.get("id")
+        session_name = session.get("name", "<unnamed>")
+        if not session_id:
+            print("Unable to resolve a valid session id.")
+            return 1
+
+        try:
+            runs_url = f"{endpoint}/api/v1/runs/query"
+            runs_payload = {"session": [session_id], "limit": 5}
+            runs = request_json(client, runs_url, method="POST", payload=runs_payload)
+        except Exception as exc:
+            print(f"Unable to query runs: {exc}")
+            return 1
 
     if isinstance(runs, dict) and "runs" in runs:
         runs_list = runs["runs"]
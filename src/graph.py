@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import json
+import os
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Literal
 
@@ -29,13 +30,39 @@ from .nodes.orchestration import (
     run_orchestration_postcheck,
     run_orchestration_precheck,
 )
+from . import json_compat
 from .state import AgentState
 
 
+_trace_chain = partial(traceable, run_type="chain") if traceable is not None else None
+
+
 def _traced_node(name: str, func):
-    if traceable is None:
+    if _trace_chain is None:
         return func
-    return traceable(name=name, run_type="chain")(func)
+    return _trace_chain(name=name)(func)
+
+
+# Node id, LangSmith trace name, callable. Edges stay as explicit add_edge calls in
+# build_graph: repo_tools.analyze_graph_structure audits them statically from the AST.
+_NODES = (
+    ("repo_investigator", "RepoInvestigator", run_repo_investigator),
+    ("orchestration_precheck", "OrchestrationPrecheck", run_orchestration_precheck),
+    ("doc_analyst", "DocAnalyst", run_doc_analyst),
+    ("doc_skipped", "DocSkipped", run_doc_skipped),
+    ("vision_inspector", "VisionInspector", run_vision_inspector),
+    ("evidence_aggregator", "EvidenceAggregator", run_evidence_aggregator),
+    ("orchestration_postcheck", "OrchestrationPostcheck", run_orchestration_postcheck),
+    ("clone_failure_handler", "CloneFailureHandler", run_clone_failure_handler),
+    ("missing_evidence_handler", "MissingEvidenceHandler", run_missing_evidence_handler),
+    ("judicial_fanout", "JudicialFanout", run_judicial_fanout),
+    ("judicial_integrity_check", "JudicialIntegrityCheck", run_judicial_integrity_check),
+    ("malformed_outputs_handler", "MalformedOutputsHandler", run_malformed_outputs_handler),
+    ("prosecutor", "Prosecutor", prosecutor_node),
+    ("defense", "Defense", defense_node),
+    ("tech_lead", "TechLead", tech_lead_node),
+    ("chief_justice", "ChiefJustice", chief_justice_node),
+)
 
 
 DEFAULT_RUBRIC = {
@@ -68,55 +95,55 @@ DEFAULT_RUBRIC = {
 }
 
 
+@lru_cache(maxsize=16)
+def _load_rubric_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # Parsed rubrics are shared across calls; callers only read them.
+    return json_compat.loads(Path(path).read_bytes())
+
+
 def load_rubric(path: str | None) -> dict:
     if not path:
         return DEFAULT_RUBRIC
-    file_path = Path(path)
-    if not file_path.exists():
+    try:
+        stat = os.stat(path)
+    except OSError:
         return DEFAULT_RUBRIC
-    return json.loads(file_path.read_text(encoding="utf-8"))
+    return _load_rubric_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+_POST_ROUTES: dict[str | None, str] = {
+    "judicial": "judicial_fanout",
+    "clone_failure": "clone_failure_handler",
+}
 
 
 def _route_doc_branch(state: AgentState) -> Literal["doc_analyst", "doc_skipped"]:
-    return state.get("routing", {}).get("doc_branch", "doc_skipped")  # type: ignore[return-value]
+    routing = state.get("routing")
+    return "doc_analyst" if routing and routing.get("doc_branch") == "doc_analyst" else "doc_skipped"
 
 
 def _route_post_orchestration(
     state: AgentState,
 ) -> Literal["judicial_fanout", "clone_failure_handler", "missing_evidence_handler"]:
-    branch = state.get("routing", {}).get("post_branch")
-    if branch == "judicial":
-        return "judicial_fanout"
-    if branch == "clone_failure":
-        return "clone_failure_handler"
-    return "missing_evidence_handler"
+    routing = state.get("routing")
+    post_branch = routing.get("post_branch") if routing else None
+    return _POST_ROUTES.get(post_branch, "missing_evidence_handler")  # type: ignore[return-value]
 
 
 def _route_judicial_branch(state: AgentState) -> Literal["chief_justice", "malformed_outputs_handler"]:
-    if state.get("routing", {}).get("judicial_branch") == "malformed_outputs_handler":
+    routing = state.get("routing")
+    if routing and routing.get("judicial_branch") == "malformed_outputs_handler":
         return "malformed_outputs_handler"
     return "chief_justice"
 
 
+@lru_cache(maxsize=1)
 def build_graph():
+    # Topology never depends on inputs, so compile (and validate) the graph once per process.
     builder = StateGraph(AgentState)
 
-    builder.add_node("repo_investigator", _traced_node("RepoInvestigator", run_repo_investigator))
-    builder.add_node("orchestration_precheck", _traced_node("OrchestrationPrecheck", run_orchestration_precheck))
-    builder.add_node("doc_analyst", _traced_node("DocAnalyst", run_doc_analyst))
-    builder.add_node("doc_skipped", _traced_node("DocSkipped", run_doc_skipped))
-    builder.add_node("vision_inspector", _traced_node("VisionInspector", run_vision_inspector))
-    builder.add_node("evidence_aggregator", _traced_node("EvidenceAggregator", run_evidence_aggregator))
-    builder.add_node("orchestration_postcheck", _traced_node("OrchestrationPostcheck", run_orchestration_postcheck))
-    builder.add_node("clone_failure_handler", _traced_node("CloneFailureHandler", run_clone_failure_handler))
-    builder.add_node("missing_evidence_handler", _traced_node("MissingEvidenceHandler", run_missing_evidence_handler))
-    builder.add_node("judicial_fanout", _traced_node("JudicialFanout", run_judicial_fanout))
-    builder.add_node("judicial_integrity_check", _traced_node("JudicialIntegrityCheck", run_judicial_integrity_check))
-    builder.add_node("malformed_outputs_handler", _traced_node("MalformedOutputsHandler", run_malformed_outputs_handler))
-    builder.add_node("prosecutor", _traced_node("Prosecutor", prosecutor_node))
-    builder.add_node("defense", _traced_node("Defense", defense_node))
-    builder.add_node("tech_lead", _traced_node("TechLead", tech_lead_node))
-    builder.add_node("chief_justice", _traced_node("ChiefJustice", chief_justice_node))
+    for node_id, trace_name, func in _NODES:
+        builder.add_node(node_id, _traced_node(trace_name, func))
 
     builder.add_edge(START, "repo_investigator")
     builder.add_edge(START, "orchestration_precheck")
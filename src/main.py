@@ -1,18 +1,35 @@
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
 from pathlib import Path
 from datetime import datetime, timezone
 
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
+from typing_extensions import NotRequired, TypedDict
 
+from . import json_compat, ollama_http
 from .graph import build_graph, load_rubric
+from .models import AuditReport, Evidence
 from .reporting import render_detective_report, write_report
 from .state import AgentState
 from .tools.repo_tools import is_url
 
 
+class _AuditJson(TypedDict):
+    repo_url: str
+    pdf_path: str | None
+    evidences: dict[str, Evidence]
+    logs: list[str]
+    audit_report: NotRequired[AuditReport]
+
+
+# Serializes the whole output document in one pydantic-core pass instead of
+# model_dump() per evidence followed by json.dumps.
+_AUDIT_JSON = TypeAdapter(_AuditJson)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the Digital Courtroom governance swarm.")
     parser.add_argument("--repo", required=True, help="Local repo path or git URL to audit.")
@@ -52,13 +69,21 @@ def validate_inputs(args: argparse.Namespace) -> None:
         if not rubric_path.exists():
             raise ValueError(f"Rubric file not found: {args.rubric}")
         try:
-            payload = json.loads(rubric_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
+            payload = json_compat.loads(rubric_path.read_bytes())
+        except json_compat.JSONDecodeError as exc:
             raise ValueError(f"Rubric file is not valid JSON: {args.rubric} ({exc})") from exc
         if not isinstance(payload, dict):
             raise ValueError(f"Rubric JSON must be an object/dict: {args.rubric}")
 
 
+async def _run_graph(app, initial_state: AgentState, config: dict) -> dict:
+    try:
+        return await app.ainvoke(initial_state, config=config)
+    finally:
+        # Pooled Ollama connections are bound to this event loop; close them before it ends.
+        await ollama_http.aclose()
+
+
 def main() -> None:
     load_dotenv()
     args = parse_args()
@@ -92,18 +117,24 @@ def main() -> None:
         "pdf_path": args.report,
         "rubric": load_rubric(args.rubric),
         "evidences": {},
+        "evidence_found_counts": {},
+        "evidence_dump": {},
         "opinions": [],
         "routing": {},
         "logs": [],
         "audit_report": None,
         "final_report": None,
     }
-    result = app.invoke(
-        initial_state,
-        config={
-            "run_name": "AutomatonAuditorFullLoop",
-            "tags": ["auditor", "langgraph", "detectives", "judges", "chief-justice"],
-        },
+    # Detective nodes are async; ainvoke lets their I/O overlap on one event loop.
+    result = asyncio.run(
+        _run_graph(
+            app,
+            initial_state,
+            config={
+                "run_name": "AutomatonAuditorFullLoop",
+                "tags": ["auditor", "langgraph", "detectives", "judges", "chief-justice"],
+            },
+        )
     )
     evidences = result.get("evidences", {})
     logs = result.get("logs", [])
@@ -117,16 +148,16 @@ def main() -> None:
 
     out_json = Path(out_json_path)
     out_json.parent.mkdir(parents=True, exist_ok=True)
-    json_data = {
+    json_data: _AuditJson = {
         "repo_url": args.repo,
         "pdf_path": args.report,
-        "evidences": {k: v.model_dump() for k, v in evidences.items()},
+        "evidences": evidences,
         "logs": logs,
     }
     if audit_report:
-        json_data["audit_report"] = audit_report.model_dump()
+        json_data["audit_report"] = audit_report
 
-    out_json.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+    out_json.write_bytes(_AUDIT_JSON.dump_json(json_data, indent=2))
     print(f"Report written to {out_path}")
     print(f"JSON written to {out_json_path}")
     if audit_report:
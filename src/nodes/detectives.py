@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import os
+from collections import deque
+
 from ..state import AgentState, Evidence
-from ..tools.doc_tools import protocol_citation_check, protocol_concept_verification, protocol_visual_audit
+from ..tools.doc_tools import (
+    ingest_pdf,
+    protocol_citation_check,
+    protocol_concept_verification,
+    protocol_visual_audit,
+)
 from ..tools.repo_tools import (
     protocol_chief_justice_rules,
     protocol_git_narrative,
@@ -11,112 +20,206 @@ from ..tools.repo_tools import (
     protocol_structured_output_contract,
     protocol_state_structure,
     protocol_vision_implementation,
+    acquire_repo,
+    release_repo,
     resolve_repo,
 )
 
 
+_PRUNED_DIRS = {"__pycache__", "node_modules", "site-packages", "venv"}
+
+
+def _walk_files(root: str) -> list[str]:
+    files: list[str] = []
+    pending: deque[tuple[str, str]] = deque([(root, "")])
+    while pending:
+        current, prefix = pending.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            rel = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                # Prune hidden and vendored trees without descending into them.
+                if entry.name.startswith(".") or entry.name in _PRUNED_DIRS:
+                    continue
+                pending.append((entry.path, rel + "/"))
+            elif entry.is_file():
+                # Symlinked files count like the baseline rglob did; only directory links are
+                # skipped, to avoid walking into loops.
+                files.append(rel)
+    return files
+
+
 def _repo_file_inventory(repo_target: str) -> list[str]:
+    try:
+        acquire_repo(repo_target)
+    except Exception:
+        return []
     try:
         path, temp_dir = resolve_repo(repo_target)
-        inventory = [
-            str(p.relative_to(path))
-            for p in path.rglob("*")
-            if p.is_file()
-        ]
-        if temp_dir:
-            temp_dir.cleanup()
-        return inventory
+        try:
+            return _walk_files(str(path))
+        finally:
+            if temp_dir:
+                temp_dir.cleanup()
     except Exception:
         return []
+    finally:
+        release_repo(repo_target)
+
+
+def _found_counts(evidences: dict[str, Evidence]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for ev_id, ev in evidences.items():
+        if ev.found:
+            namespace = ev_id.split(".", 1)[0]
+            counts[namespace] = counts.get(namespace, 0) + 1
+    return counts
+
+
+_REPO_PROTOCOLS = (
+    protocol_state_structure,
+    protocol_graph_wiring,
+    protocol_git_narrative,
+    protocol_security_scan,
+    protocol_judicial_personas,
+    protocol_structured_output_contract,
+    protocol_chief_justice_rules,
+    protocol_vision_implementation,
+)
 
 
-def run_repo_investigator(state: AgentState) -> dict:
-    evidences: dict[str, Evidence] = {}
-    for protocol in (
-        protocol_state_structure,
-        protocol_graph_wiring,
-        protocol_git_narrative,
-        protocol_security_scan,
-        protocol_judicial_personas,
-        protocol_structured_output_contract,
-        protocol_chief_justice_rules,
-        protocol_vision_implementation,
-    ):
-        ev = protocol(state["repo_url"])
-        evidences[ev.id] = ev
-    return {"evidences": evidences, "logs": ["RepoInvestigator completed"]}  # type: ignore[return-value]
-
-
-def run_doc_analyst(state: AgentState) -> dict:
-    known_paths = _repo_file_inventory(state["repo_url"])
-    citation = protocol_citation_check(state.get("pdf_path"), known_paths)
-    concept = protocol_concept_verification(state.get("pdf_path"))
+async def run_repo_investigator(state: AgentState) -> dict:
+    # Protocols are I/O bound (disk, git subprocess, clones); run them concurrently
+    # off the event loop. gather keeps evidence insertion order deterministic.
+    # One clone serves every protocol for this run; the lease is dropped once they finish.
+    # If cloning fails, each protocol retries and reports the access error itself.
+    repo_url = state["repo_url"]
+    try:
+        await asyncio.to_thread(acquire_repo, repo_url)
+        leased = True
+    except Exception:
+        leased = False
+    try:
+        results = await asyncio.gather(
+            *(asyncio.to_thread(protocol, repo_url) for protocol in _REPO_PROTOCOLS)
+        )
+    finally:
+        if leased:
+            release_repo(repo_url)
+    evidences: dict[str, Evidence] = {ev.id: ev for ev in results}
     return {
-        "evidences": {citation.id: citation, concept.id: concept},
-        "logs": ["DocAnalyst completed"],
+        "evidences": evidences,
+        "evidence_found_counts": _found_counts(evidences),
+        "logs": ["RepoInvestigator completed"],
     }
 
 
-def run_doc_skipped(state: AgentState) -> dict:
+async def run_doc_analyst(state: AgentState) -> dict:
+    pdf_path = state.get("pdf_path")
+    inventory = asyncio.create_task(asyncio.to_thread(_repo_file_inventory, state["repo_url"]))
+    tasks = [inventory]
+    try:
+        # Validate and ingest the report once; both protocols share the parsed chunks.
+        chunks = None
+        if pdf_path and os.path.exists(pdf_path):
+            chunks = await asyncio.to_thread(ingest_pdf, pdf_path)
+        concept = asyncio.create_task(asyncio.to_thread(protocol_concept_verification, pdf_path, chunks))
+        tasks.append(concept)
+        known_paths = await inventory
+        citation = await asyncio.to_thread(protocol_citation_check, pdf_path, known_paths, chunks)
+        concept_ev = await concept
+    finally:
+        # On failure, never leave a background task pending or its exception unretrieved.
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    evidences = {citation.id: citation, concept_ev.id: concept_ev}
     return {
-        "logs": [
-            "DocAnalyst skipped: no PDF report path provided; continuing with repository-only evidence."
-        ]
+        "evidences": evidences,
+        "evidence_found_counts": _found_counts(evidences),
+        "logs": ["DocAnalyst completed"],
     }
 
 
+# Static handler messages. Handlers still return a fresh one-item list each call: the logs
+# channel reduces with operator.add, which rejects tuples and must not alias shared lists.
+_DOC_SKIPPED_LOG = "DocAnalyst skipped: no PDF report path provided; continuing with repository-only evidence."
+_CLONE_FAILURE_LOG = (
+    "CloneFailureHandler: repository access failed (repo_access_error detected); "
+    "continuing with degraded judicial pass for transparent reporting."
+)
+_MISSING_EVIDENCE_LOG = (
+    "MissingEvidenceHandler: required detective evidence incomplete; "
+    "continuing to judicial pass with partial evidence."
+)
+_MALFORMED_OUTPUTS_LOG = (
+    "MalformedOutputsHandler: malformed or incomplete judicial outputs detected; "
+    "continuing to Chief Justice with deterministic fallbacks."
+)
+
+
+def run_doc_skipped(state: AgentState) -> dict:
+    return {"logs": [_DOC_SKIPPED_LOG]}
+
+
 def run_vision_inspector(state: AgentState) -> dict:
     vision_evidence = protocol_visual_audit(state.get("pdf_path"))
+    evidences = {vision_evidence.id: vision_evidence}
     return {
-        "evidences": {vision_evidence.id: vision_evidence},
+        "evidences": evidences,
+        "evidence_found_counts": _found_counts(evidences),
         "logs": ["VisionInspector completed"],
     }
 
 
+def found_evidence_counts(state: AgentState) -> dict[str, int]:
+    counts = state.get("evidence_found_counts")
+    return counts if counts is not None else _found_counts(state["evidences"])
+
+
+def found_evidence_flags(state: AgentState) -> tuple[bool, bool]:
+    counts = state.get("evidence_found_counts")
+    if counts is not None:
+        return counts.get("repo", 0) > 0, counts.get("doc", 0) > 0
+
+    # States built without the counts channel: one pass with early exit.
+    has_repo = has_doc = False
+    for ev_id, ev in state["evidences"].items():
+        if not ev.found:
+            continue
+        if not has_repo and ev_id.startswith("repo."):
+            has_repo = True
+        elif not has_doc and ev_id.startswith("doc."):
+            has_doc = True
+        if has_repo and has_doc:
+            break
+    return has_repo, has_doc
+
+
 def run_evidence_aggregator(state: AgentState) -> dict:
     evidence_count = len(state["evidences"])
-    has_repo = any(
-        ev_id.startswith("repo.") and ev.found
-        for ev_id, ev in state["evidences"].items()
-    )
-    has_doc = any(
-        ev_id.startswith("doc.") and ev.found
-        for ev_id, ev in state["evidences"].items()
-    )
+    has_repo, has_doc = found_evidence_flags(state)
     doc_required = bool(state.get("pdf_path"))
     status = "ready" if (has_repo and (has_doc or not doc_required)) else "incomplete"
     return {
         "logs": [
-            (
-                f"EvidenceAggregator completed: evidence_count={evidence_count}, "
-                f"repo_evidence={has_repo}, doc_evidence={has_doc}, doc_required={doc_required}, status={status}"
-            )
+            f"EvidenceAggregator completed: evidence_count={evidence_count}, "
+            f"repo_evidence={has_repo}, doc_evidence={has_doc}, doc_required={doc_required}, status={status}"
         ]
     }
 
 
 def run_clone_failure_handler(state: AgentState) -> dict:
-    return {
-        "logs": [
-            "CloneFailureHandler: repository access failed (repo_access_error detected); "
-            "continuing with degraded judicial pass for transparent reporting."
-        ]
-    }
+    return {"logs": [_CLONE_FAILURE_LOG]}
 
 
 def run_missing_evidence_handler(state: AgentState) -> dict:
-    return {
-        "logs": [
-            "MissingEvidenceHandler: required detective evidence incomplete; "
-            "continuing to judicial pass with partial evidence."
-        ]
-    }
+    return {"logs": [_MISSING_EVIDENCE_LOG]}
 
 
 def run_malformed_outputs_handler(state: AgentState) -> dict:
-    return {
-        "logs": [
-            "MalformedOutputsHandler: malformed or incomplete judicial outputs detected; "
-            "continuing to Chief Justice with deterministic fallbacks."
-        ]
-    }
+    return {"logs": [_MALFORMED_OUTPUTS_LOG]}
@@ -1,22 +1,25 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import os
-import urllib.error
-import urllib.request
 from difflib import SequenceMatcher
+from functools import lru_cache
+from pathlib import Path
 import re
 from typing import Literal
 
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+import httpx
+from pydantic import BaseModel
 
+from .. import json_compat, ollama_http
 from ..models import JudicialOpinion, Statute
 from ..state import AgentState
 
 JudgeName = Literal["Prosecutor", "Defense", "TechLead"]
 
 
+@lru_cache(maxsize=3)
 def _judge_system_prompt(judge: JudgeName) -> str:
     if judge == "Prosecutor":
         return (
@@ -46,16 +49,17 @@ def _criteria(state: AgentState) -> list[dict]:
 
 
 def _evidence_payload(state: AgentState) -> dict:
+    dumped = state.get("evidence_dump")
+    if dumped and len(dumped) == len(state["evidences"]):
+        return dumped
     return {k: v.model_dump() for k, v in state["evidences"].items()}
 
 
+_STATUTE_BY_VALUE: dict[str, Statute] = {statute.value: statute for statute in Statute}
+
+
 def _coerce_statute(raw: str | None) -> Statute:
-    if not raw:
-        return Statute.ENGINEERING
-    for statute in Statute:
-        if statute.value == raw:
-            return statute
-    return Statute.ENGINEERING
+    return _STATUTE_BY_VALUE.get(raw, Statute.ENGINEERING) if raw else Statute.ENGINEERING
 
 
 _CRITERION_EVIDENCE_HINTS: dict[str, list[str]] = {
@@ -72,42 +76,87 @@ _CRITERION_EVIDENCE_HINTS: dict[str, list[str]] = {
 }
 
 
-def _criterion_relevant_evidence_keys(criterion: dict, evidence: dict) -> list[str]:
-    cid = str(criterion.get("id", "")).strip().lower()
-    cname = str(criterion.get("name", "")).strip().lower()
+_KEYWORD_SYNONYMS: dict[str, set[str]] = {
+    "git": {"commit", "history"},
+    "state": {"typed", "typedict", "pydantic", "reducers"},
+    "orchestration": {"graph", "fan", "parallel", "edge"},
+    "security": {"unsafe", "sandbox", "subprocess"},
+    "documentation": {"doc", "pdf", "concept"},
+    "diagram": {"visual", "vision"},
+}
+
+_KEYWORD_RE = re.compile(r"[a-z0-9_]+")
 
-    hinted = [k for k in _CRITERION_EVIDENCE_HINTS.get(cid, []) if k in evidence]
-    if hinted:
-        return hinted
+# Single-slot memo: every criterion and judge in a run scores against the same evidence
+# payload object, so its lowercased search text and per-criterion relevant keys are built
+# once rather than per criterion and judge.
+_evidence_memo: tuple[dict, dict[str, str], dict[tuple[str, str], tuple[list[str], bool]]] | None = None
 
-    keywords = set(re.findall(r"[a-z0-9_]+", f"{cid} {cname}"))
-    keywords = {k for k in keywords if len(k) > 2 and k not in {"the", "and", "for"}}
 
-    synonym_map = {
-        "git": {"commit", "history"},
-        "state": {"typed", "typedict", "pydantic", "reducers"},
-        "orchestration": {"graph", "fan", "parallel", "edge"},
-        "security": {"unsafe", "sandbox", "subprocess"},
-        "documentation": {"doc", "pdf", "concept"},
-        "diagram": {"visual", "vision"},
+def _evidence_memo_for(evidence: dict) -> tuple[dict[str, str], dict[tuple[str, str], tuple[list[str], bool]]]:
+    global _evidence_memo
+    memo = _evidence_memo
+    if memo is not None and memo[0] is evidence:
+        return memo[1], memo[2]
+    haystacks = {
+        key: f"{key} {' '.join(value.get('tags', []))} {value.get('goal', '')} {value.get('rationale', '')}".lower()
+        for key, value in evidence.items()
     }
+    _evidence_memo = (evidence, haystacks, {})
+    return haystacks, _evidence_memo[2]
 
+
+@lru_cache(maxsize=256)
+def _criterion_keywords(cid: str, cname: str) -> frozenset[str]:
+    keywords = {k for k in _KEYWORD_RE.findall(f"{cid} {cname}") if len(k) > 2 and k not in {"the", "and", "for"}}
     expanded = set(keywords)
-    for kw in list(keywords):
-        expanded.update(synonym_map.get(kw, set()))
+    for kw in keywords:
+        expanded.update(_KEYWORD_SYNONYMS.get(kw, set()))
+    return frozenset(expanded)
 
-    relevant: list[str] = []
-    for key, value in evidence.items():
-        tags = " ".join(value.get("tags", []))
-        haystack = f"{key} {tags} {value.get('goal', '')} {value.get('rationale', '')}".lower()
-        if any(token in haystack for token in expanded):
-            relevant.append(key)
 
+@lru_cache(maxsize=256)
+def _criterion_pattern(cid: str, cname: str) -> re.Pattern[str] | None:
+    # One alternation scan per haystack instead of a substring test per keyword.
+    keywords = _criterion_keywords(cid, cname)
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(keyword) for keyword in sorted(keywords)))
+
+
+def _criterion_relevant_evidence_keys(criterion: dict, evidence: dict) -> tuple[list[str], bool]:
+    cid = str(criterion.get("id", "")).strip().lower()
+    cname = str(criterion.get("name", "")).strip().lower()
+
+    haystacks, relevant_by_criterion = _evidence_memo_for(evidence)
+    cached = relevant_by_criterion.get((cid, cname))
+    if cached is not None:
+        return cached
+
+    relevant = [k for k in _CRITERION_EVIDENCE_HINTS.get(cid, []) if k in evidence]
+    if not relevant:
+        pattern = _criterion_pattern(cid, cname)
+        if pattern is not None:
+            relevant = [key for key, haystack in haystacks.items() if pattern.search(haystack)]
     if relevant:
-        return relevant
+        result = (relevant, True)
+    else:
+        # Fallback to all evidence if no criterion-specific match is possible.
+        result = (list(evidence.keys()), False)
 
-    # Fallback to all evidence if no criterion-specific match is possible.
-    return list(evidence.keys())
+    relevant_by_criterion[(cid, cname)] = result
+    return result
+
+
+def _heuristic_only(criterion: dict, evidence: dict) -> bool:
+    # Nothing criterion-specific and almost nothing found: an LLM call cannot do better than
+    # the deterministic heuristic, so skip the round trip.
+    _, matched = _criterion_relevant_evidence_keys(criterion, evidence)
+    if matched:
+        return False
+    # Unmatched criteria fall back to every evidence key, so walk the values directly.
+    found = sum(1 for ev in evidence.values() if ev.get("found"))
+    return found < 0.1 * max(len(evidence), 1)
 
 
 def _score_from_ratio(judge: JudgeName, ratio: float) -> int:
@@ -141,8 +190,8 @@ def _heuristic_score(judge: JudgeName, criterion: dict, evidence: dict) -> Judic
     cid = criterion["id"]
     statute = _coerce_statute(criterion.get("statute"))
 
-    relevant_keys = _criterion_relevant_evidence_keys(criterion, evidence)
-    relevant = [evidence[k] for k in relevant_keys if k in evidence]
+    relevant_keys, _ = _criterion_relevant_evidence_keys(criterion, evidence)
+    relevant = [ev for k in relevant_keys if (ev := evidence.get(k)) is not None]
 
     if str(cid).strip().lower() == "report_accuracy" and "doc.citation_check" in evidence:
         citation_ev = evidence["doc.citation_check"]
@@ -188,50 +237,103 @@ def _heuristic_score(judge: JudgeName, criterion: dict, evidence: dict) -> Judic
     )
 
 
-def _build_judge_llm():
-    provider = os.getenv("LLM_PROVIDER", "auto").lower()
-    
-    if provider in {"auto", "gemini"} and os.getenv("GEMINI_API_KEY"):
+_LLM_PROVIDERS = ("gemini", "grok", "openai", "deepseek")
+_JUDGE_SLOTS: dict[str, int] = {"Prosecutor": 0, "Defense": 1, "TechLead": 2}
+
+
+_PROVIDER_KEY_ENV: dict[str, str] = {
+    "gemini": "GEMINI_API_KEY",
+    "grok": "GROK_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+}
+
+
+@lru_cache(maxsize=4)
+def _build_judge_llm_for(name: str):
+    api_key = os.getenv(_PROVIDER_KEY_ENV[name])
+    if not api_key:
+        return None
+
+    # Provider SDKs are imported on first use so heuristic-only runs never load them.
+    if name == "gemini":
         from langchain_google_genai import ChatGoogleGenerativeAI
         return ChatGoogleGenerativeAI(
             model=os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
-            api_key=os.getenv("GEMINI_API_KEY"),
+            api_key=api_key,
             temperature=0.1,
         )
 
-    if provider in {"auto", "grok"} and os.getenv("GROK_API_KEY"):
+    from langchain_openai import ChatOpenAI
+
+    if name == "grok":
         return ChatOpenAI(
             model=os.getenv("GROK_MODEL", "grok-2-latest"),
-            api_key=os.getenv("GROK_API_KEY"),
+            api_key=api_key,
             base_url=os.getenv("GROK_BASE_URL", "https://api.x.ai/v1"),
             temperature=0.1,
         )
 
-    if provider in {"auto", "openai"} and os.getenv("OPENAI_API_KEY"):
+    if name == "openai":
         return ChatOpenAI(
             model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            api_key=os.getenv("OPENAI_API_KEY"),
-            temperature=0.1,
-        )
-
-    api_key = os.getenv("DEEPSEEK_API_KEY")
-    if api_key:
-        model = os.getenv("OPENAI_MODEL_OVERRIDE", "deepseek-v3.2:cloud")
-        return ChatOpenAI(
-            model=model,
             api_key=api_key,
-            base_url=os.getenv("DEEPSEEK_API_BASE", "https://api.deepseek.com/v1"),
             temperature=0.1,
         )
-    return None
+
+    model = os.getenv("OPENAI_MODEL_OVERRIDE", "deepseek-v3.2:cloud")
+    return ChatOpenAI(
+        model=model,
+        api_key=api_key,
+        base_url=os.getenv("DEEPSEEK_API_BASE", "https://api.deepseek.com/v1"),
+        temperature=0.1,
+    )
+
+
+@lru_cache(maxsize=1)
+def _judge_llms() -> tuple:
+    provider = os.getenv("LLM_PROVIDER", "auto").lower()
+    # Round-robin spreads judge calls over every configured provider's rate limit; by default
+    # only the highest-priority provider is used so scores come from a single model.
+    round_robin = os.getenv("JUDGE_PROVIDER_ROUND_ROBIN", "").lower() in {"1", "true", "yes"}
+    llms = []
+    for name in _LLM_PROVIDERS:
+        if provider in {"auto", name} and (llm := _build_judge_llm_for(name)) is not None:
+            llms.append(llm)
+            if not round_robin:
+                break
+    if not llms and (deepseek := _build_judge_llm_for("deepseek")) is not None:
+        llms.append(deepseek)
+    return tuple(llms)
+
+
+def _build_judge_llm():
+    llms = _judge_llms()
+    return llms[0] if llms else None
+
+
+def _llm_slot(judge: JudgeName, offset: int = 0) -> int:
+    return (_JUDGE_SLOTS[judge] + offset) % max(len(_judge_llms()), 1)
+
+
+def _bound_opinion(opinion: JudicialOpinion, judge: JudgeName, criterion_id: str, statute: Statute) -> JudicialOpinion:
+    # The model output already passed validation; pin it to the requesting judge and criterion
+    # without another validated copy.
+    return JudicialOpinion.model_construct(
+        judge=judge,
+        criterion_id=criterion_id,
+        statute=statute,
+        score=max(1, min(5, opinion.score)),
+        argument=opinion.argument,
+        cited_evidence=opinion.cited_evidence,
+    )
 
 
-def _maybe_ollama_opinion(judge: JudgeName, criterion: dict, evidence: dict) -> JudicialOpinion | None:
+async def _maybe_ollama_opinion(judge: JudgeName, criterion: dict, evidence_json: str) -> JudicialOpinion | None:
     model = os.getenv("OLLAMA_MODEL")
     if not model:
         return None
 
-    base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434").rstrip("/")
     cid = criterion["id"]
     statute = _coerce_statute(criterion.get("statute"))
     payload = {
@@ -245,94 +347,315 @@ def _maybe_ollama_opinion(judge: JudgeName, criterion: dict, evidence: dict) ->
                 "content": (
                     f"Criterion ID: {cid}\n"
                     f"Statute: {statute.value}\n"
-                    f"Evidence JSON:\n{json.dumps(evidence)}\n\n"
+                    f"Evidence JSON:\n{evidence_json}\n\n"
                     "Return JSON with keys: judge, criterion_id, statute, score (1-5), argument, cited_evidence."
                 ),
             },
         ],
         "options": {"temperature": 0.1},
     }
-    req = urllib.request.Request(
-        f"{base_url}/api/chat",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            raw = resp.read().decode("utf-8")
-        content = json.loads(raw).get("message", {}).get("content", "")
+        content = await ollama_http.chat(payload)
         if not content:
             return None
-        opinion = JudicialOpinion.model_validate_json(content)
-        return opinion.model_copy(
-            update={
+        return _bound_opinion(JudicialOpinion.model_validate_json(content), judge, cid, statute)
+    except (ollama_http.Error, json_compat.JSONDecodeError, ValueError):
+        return None
+
+
+class _OpinionBatch(BaseModel):
+    opinions: list[JudicialOpinion]
+
+
+def _normalize_batch(judge: JudgeName, criteria: list[dict], batch: _OpinionBatch) -> dict[str, JudicialOpinion]:
+    by_id = {criterion["id"]: criterion for criterion in criteria}
+    opinions: dict[str, JudicialOpinion] = {}
+    for opinion in batch.opinions:
+        criterion = by_id.get(opinion.criterion_id)
+        if criterion is None or opinion.criterion_id in opinions:
+            continue
+        opinions[opinion.criterion_id] = _bound_opinion(
+            opinion, judge, opinion.criterion_id, _coerce_statute(criterion.get("statute"))
+        )
+    return opinions
+
+
+async def _maybe_ollama_batch(judge: JudgeName, criteria: list[dict], evidence_json: str) -> dict[str, JudicialOpinion]:
+    model = os.getenv("OLLAMA_MODEL")
+    if not model:
+        return {}
+
+    payload = {
+        "model": model,
+        "stream": False,
+        "format": "json",
+        "messages": [
+            {"role": "system", "content": _judge_system_prompt(judge)},
+            {
+                "role": "user",
+                "content": (
+                    f"Criteria JSON:\n{json_compat.dumps(criteria)}\n"
+                    f"Evidence JSON:\n{evidence_json}\n\n"
+                    "Return JSON with key opinions: a list with one entry per criterion, each with keys: "
+                    f"judge ({judge}), criterion_id, statute, score (1-5), argument, cited_evidence."
+                ),
+            },
+        ],
+        "options": {"temperature": 0.1},
+    }
+    try:
+        content = await ollama_http.chat(payload)
+        if not content:
+            return {}
+        return _normalize_batch(judge, criteria, _OpinionBatch.model_validate_json(content))
+    except (ollama_http.Error, json_compat.JSONDecodeError, ValueError):
+        return {}
+
+
+@lru_cache(maxsize=1)
+def _transient_llm_errors() -> tuple[type[BaseException], ...]:
+    # Only timeouts, dropped connections, rate limits and server errors are worth another
+    # attempt; auth, bad-model and structured-output failures go straight to the heuristic.
+    errors: list[type[BaseException]] = [httpx.TransportError]
+    try:
+        import openai
+
+        errors += [openai.APITimeoutError, openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError]
+    except ImportError:
+        pass
+    try:
+        from google.genai import errors as genai_errors
+
+        errors.append(genai_errors.ServerError)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+@lru_cache(maxsize=12)
+def _judge_chain(judge: JudgeName, slot: int = 0):
+    from langchain_core.prompts import ChatPromptTemplate
+
+    structured = _judge_llms()[slot].with_structured_output(JudicialOpinion).with_retry(
+        retry_if_exception_type=_transient_llm_errors(), stop_after_attempt=3, wait_exponential_jitter=True
+    )
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", _judge_system_prompt(judge)),
+            (
+                "human",
+                "Criterion JSON:\n{criterion}\n\nEvidence JSON:\n{evidence}\n\n"
+                "Return JudicialOpinion JSON with:\n"
+                "- judge: {judge}\n"
+                "- criterion_id: {criterion_id}\n"
+                "- statute: {statute}\n"
+                "- score: int in [1,5]\n"
+                "- argument: concise legal-style rationale\n"
+                "- cited_evidence: existing evidence ids only",
+            ),
+        ]
+    )
+    return prompt | structured
+
+
+@lru_cache(maxsize=12)
+def _judge_batch_chain(judge: JudgeName, slot: int = 0):
+    from langchain_core.prompts import ChatPromptTemplate
+
+    structured = _judge_llms()[slot].with_structured_output(_OpinionBatch).with_retry(
+        retry_if_exception_type=_transient_llm_errors(), stop_after_attempt=3, wait_exponential_jitter=True
+    )
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", _judge_system_prompt(judge)),
+            (
+                "human",
+                "Criteria JSON:\n{criteria}\n\nEvidence JSON:\n{evidence}\n\n"
+                "Return an object with key opinions: one JudicialOpinion per criterion, each with:\n"
+                "- judge: {judge}\n"
+                "- criterion_id: the criterion's id\n"
+                "- statute: the criterion's statute\n"
+                "- score: int in [1,5]\n"
+                "- argument: concise legal-style rationale\n"
+                "- cited_evidence: existing evidence ids only",
+            ),
+        ]
+    )
+    return prompt | structured
+
+
+async def _maybe_llm_batch(judge: JudgeName, criteria: list[dict], evidence_json: str) -> dict[str, JudicialOpinion]:
+    try:
+        out = await _judge_batch_chain(judge, _llm_slot(judge)).ainvoke(
+            {
                 "judge": judge,
-                "criterion_id": cid,
-                "statute": statute,
-                "score": max(1, min(5, opinion.score)),
+                "criteria": json_compat.dumps(criteria),
+                "evidence": evidence_json,
             }
         )
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, ValueError):
-        return None
+    except Exception:
+        return {}
+    return _normalize_batch(judge, criteria, out)
 
 
-def _maybe_llm_opinion(judge: JudgeName, criterion: dict, evidence: dict) -> JudicialOpinion:
+async def _maybe_llm_opinion(
+    judge: JudgeName, criterion: dict, evidence_json: str, slot: int = 0
+) -> JudicialOpinion | None:
     provider = os.getenv("LLM_PROVIDER", "auto").lower()
     if provider in {"auto", "ollama"}:
-        ollama_out = _maybe_ollama_opinion(judge, criterion, evidence)
-        if ollama_out is not None:
+        ollama_out = await _maybe_ollama_opinion(judge, criterion, evidence_json)
+        if ollama_out is not None or provider == "ollama":
             return ollama_out
-        if provider == "ollama":
-            return _heuristic_score(judge, criterion, evidence)
 
-    llm = _build_judge_llm()
-    if llm is None:
-        return _heuristic_score(judge, criterion, evidence)
+    if _build_judge_llm() is None:
+        return None
 
     cid = criterion["id"]
     statute = _coerce_statute(criterion.get("statute"))
     try:
-        structured = llm.with_structured_output(JudicialOpinion)
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", _judge_system_prompt(judge)),
-                (
-                    "human",
-                    "Criterion JSON:\n{criterion}\n\nEvidence JSON:\n{evidence}\n\n"
-                    "Return JudicialOpinion JSON with:\n"
-                    "- judge: {judge}\n"
-                    "- criterion_id: {criterion_id}\n"
-                    "- statute: {statute}\n"
-                    "- score: int in [1,5]\n"
-                    "- argument: concise legal-style rationale\n"
-                    "- cited_evidence: existing evidence ids only",
-                ),
-            ]
-        )
-        chain = prompt | structured
-        out = chain.invoke(
+        chain = _judge_chain(judge, slot)
+        out = await chain.ainvoke(
             {
                 "judge": judge,
                 "criterion_id": cid,
                 "statute": statute.value,
-                "criterion": json.dumps(criterion),
-                "evidence": json.dumps(evidence),
-            }
-        )
-        return out.model_copy(
-            update={
-                "judge": judge,
-                "criterion_id": cid,
-                "statute": statute,
-                "score": max(1, min(5, out.score)),
+                "criterion": json_compat.dumps(criterion),
+                "evidence": evidence_json,
             }
         )
+        return _bound_opinion(out, judge, cid, statute)
     except Exception:
-        return _heuristic_score(judge, criterion, evidence)
+        return None
+
+
+# Opinions already produced by an LLM, keyed by a run digest then (judge, criterion_id).
+# Repeat judge calls in one process reuse them from memory; with JUDGE_CHECKPOINT_DIR set,
+# each digest is also mirrored to an append-only JSONL file so reruns skip the round trips.
+# The digest covers the evidence, the criteria, the judge prompt and the provider/model
+# settings, so changing any of them misses.
+_CHECKPOINTS: dict[str, dict[tuple[str, str], JudicialOpinion]] = {}
+_CHECKPOINT_ENV = (
+    "LLM_PROVIDER",
+    "JUDGE_PROVIDER_ROUND_ROBIN",
+    "OLLAMA_MODEL",
+    "GEMINI_MODEL",
+    "GROK_MODEL",
+    "OPENAI_MODEL",
+    "OPENAI_MODEL_OVERRIDE",
+)
+
+
+def _checkpoint_digest(judge: JudgeName, criteria: list[dict], evidence_json: str) -> str:
+    config = json_compat.dumpb(
+        [_judge_system_prompt(judge), criteria, [os.getenv(name) for name in _CHECKPOINT_ENV]]
+    )
+    digest = hashlib.blake2b(config, digest_size=16)
+    digest.update(evidence_json.encode("utf-8"))
+    return digest.hexdigest()
+
 
+def _checkpoint_path(digest: str) -> Path | None:
+    root = os.getenv("JUDGE_CHECKPOINT_DIR")
+    return Path(root) / f"{digest}.jsonl" if root else None
 
-def _judge_node(state: AgentState, judge: JudgeName) -> dict:
+
+def _load_checkpoint(digest: str) -> dict[tuple[str, str], JudicialOpinion]:
+    done = _CHECKPOINTS.get(digest)
+    if done is not None:
+        return done
+    done = _CHECKPOINTS[digest] = {}
+    path = _checkpoint_path(digest)
+    try:
+        lines = path.read_bytes().splitlines() if path is not None else []
+    except OSError:
+        lines = []
+    for line in lines:
+        try:
+            opinion = JudicialOpinion.model_validate_json(line)
+        except ValueError:
+            continue
+        done[(opinion.judge, opinion.criterion_id)] = opinion
+    return done
+
+
+def _save_checkpoint(digest: str, opinions: list[JudicialOpinion]) -> None:
+    if not opinions:
+        return
+    done = _load_checkpoint(digest)
+    for opinion in opinions:
+        done[(opinion.judge, opinion.criterion_id)] = opinion
+    path = _checkpoint_path(digest)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as fh:
+            fh.write(b"".join(opinion.model_dump_json().encode("utf-8") + b"\n" for opinion in opinions))
+    except OSError:
+        pass
+
+
+def _judge_parallelism() -> int:
+    try:
+        value = int(os.getenv("JUDGE_PARALLELISM") or 4)
+    except ValueError:
+        value = 4
+    return max(1, value)
+
+
+async def _score_with_llm(
+    judge: JudgeName, criteria: list[dict], evidence: dict
+) -> tuple[dict[str, JudicialOpinion], str | None]:
+    # Serialize once per judge node; every criterion prompt embeds the same evidence.
+    evidence_json = json_compat.dumps(evidence)
+    digest = _checkpoint_digest(judge, criteria, evidence_json)
+    done = _load_checkpoint(digest)
+    opinions = {c["id"]: done[(judge, c["id"])] for c in criteria if (judge, c["id"]) in done}
+    criteria = [criterion for criterion in criteria if criterion["id"] not in opinions]
+    if not criteria:
+        return opinions, f"checkpointed={len(opinions)}"
+
+    provider = os.getenv("LLM_PROVIDER", "auto").lower()
+    ollama_first = provider == "ollama" or (provider == "auto" and bool(os.getenv("OLLAMA_MODEL")))
+    if not ollama_first and _build_judge_llm() is not None:
+        # One structured call covers every criterion; gaps fall back to heuristics.
+        batched = await _maybe_llm_batch(judge, criteria, evidence_json)
+        _save_checkpoint(digest, list(batched.values()))
+        for criterion in criteria:
+            opinions[criterion["id"]] = batched.get(criterion["id"]) or _heuristic_score(judge, criterion, evidence)
+        return opinions, f"batched={len(batched)}/{len(criteria)}"
+
+    # Ollama scores every criterion in one round trip first. Whatever it leaves out or
+    # malforms goes to the cloud judge as one more batch when one is configured, and only
+    # the rest is scored per criterion below.
+    batched = await _maybe_ollama_batch(judge, criteria, evidence_json) if ollama_first else {}
+    remaining = [criterion for criterion in criteria if criterion["id"] not in batched]
+    note = None
+    if remaining and provider != "ollama" and _build_judge_llm() is not None:
+        cloud_batched = await _maybe_llm_batch(judge, remaining, evidence_json)
+        note = f"batched={len(cloud_batched)}/{len(remaining)}"
+        batched.update(cloud_batched)
+        remaining = [criterion for criterion in remaining if criterion["id"] not in batched]
+
+    # Criteria are independent, I/O-bound LLM round-trips; JUDGE_PARALLELISM bounds in-flight
+    # requests per judge to stay within provider rate limits.
+    limit = asyncio.Semaphore(_judge_parallelism())
+
+    async def score(index: int, criterion: dict) -> JudicialOpinion | None:
+        async with limit:
+            return await _maybe_llm_opinion(judge, criterion, evidence_json, _llm_slot(judge, index))
+
+    results = await asyncio.gather(*(score(i, c) for i, c in enumerate(remaining)), return_exceptions=True)
+    for criterion, result in zip(remaining, results):
+        if isinstance(result, JudicialOpinion):
+            batched[criterion["id"]] = result
+    _save_checkpoint(digest, list(batched.values()))
+    for criterion in criteria:
+        opinions[criterion["id"]] = batched.get(criterion["id"]) or _heuristic_score(judge, criterion, evidence)
+    return opinions, note
+
+
+async def _judge_node(state: AgentState, judge: JudgeName) -> dict:
     criteria = _criteria(state)
     existing = {op.criterion_id for op in state["opinions"] if op.judge == judge}
     pending = [criterion for criterion in criteria if criterion["id"] not in existing]
@@ -340,20 +663,30 @@ def _judge_node(state: AgentState, judge: JudgeName) -> dict:
         return {"logs": [f"{judge} skipped (already evaluated)"]}
 
     evidence = _evidence_payload(state)
-    opinions = [_maybe_llm_opinion(judge, criterion, evidence) for criterion in pending]
-    return {"opinions": opinions, "logs": [f"{judge} completed"]}
+    scored = {c["id"]: _heuristic_score(judge, c, evidence) for c in pending if _heuristic_only(c, evidence)}
+    notes = [f"heuristic_only={len(scored)}"] if scored else []
+    to_llm = [criterion for criterion in pending if criterion["id"] not in scored]
+    if to_llm:
+        llm_scored, note = await _score_with_llm(judge, to_llm, evidence)
+        scored.update(llm_scored)
+        if note:
+            notes.append(note)
+
+    opinions = [scored[criterion["id"]] for criterion in pending]
+    suffix = f" ({', '.join(notes)})" if notes else ""
+    return {"opinions": opinions, "logs": [f"{judge} completed{suffix}"]}
 
 
-def prosecutor_node(state: AgentState) -> dict:
-    return _judge_node(state, "Prosecutor")
+async def prosecutor_node(state: AgentState) -> dict:
+    return await _judge_node(state, "Prosecutor")
 
 
-def defense_node(state: AgentState) -> dict:
-    return _judge_node(state, "Defense")
+async def defense_node(state: AgentState) -> dict:
+    return await _judge_node(state, "Defense")
 
 
-def tech_lead_node(state: AgentState) -> dict:
-    return _judge_node(state, "TechLead")
+async def tech_lead_node(state: AgentState) -> dict:
+    return await _judge_node(state, "TechLead")
 
 
 def detect_persona_collusion(state: AgentState) -> dict:
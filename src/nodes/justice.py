@@ -1,100 +1,201 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
+import re
 
 from ..models import AuditReport, CriterionBreakdown, JudicialOpinion, Statute
 from ..reporting import render_audit_report_markdown
 from ..state import AgentState
 
+_UTC = timezone.utc
+
+
+_STATUTE_BY_VALUE: dict[str, Statute] = {statute.value: statute for statute in Statute}
+
 
 def _coerce_statute(raw: str | None) -> Statute:
-    if not raw:
-        return Statute.ENGINEERING
-    for statute in Statute:
-        if statute.value == raw:
-            return statute
-    return Statute.ENGINEERING
+    return _STATUTE_BY_VALUE.get(raw, Statute.ENGINEERING) if raw else Statute.ENGINEERING
+
+
+# Deterministic stand-ins for judges that produced no opinion.
+_FALLBACK_ARGUMENTS: dict[str, str] = {
+    "Prosecutor": "Missing Prosecutor opinion; defaulting to strict score.",
+    "Defense": "Missing Defense opinion; defaulting to minimal score.",
+    "TechLead": "Missing TechLead opinion; defaulting to minimal score.",
+}
+
+
+@lru_cache(maxsize=256)
+def _fallback_opinion(judge: str, criterion_id: str, statute: Statute) -> JudicialOpinion:
+    return JudicialOpinion.model_construct(
+        judge=judge,
+        criterion_id=criterion_id,
+        statute=statute,
+        score=1,
+        argument=_FALLBACK_ARGUMENTS[judge],
+        cited_evidence=[],
+    )
+
+
+def _opinion_or_fallback(
+    by_criterion_judge: dict[tuple[str, str], JudicialOpinion], criterion_id: str, judge: str, statute: Statute
+) -> JudicialOpinion:
+    opinion = by_criterion_judge.get((criterion_id, judge))
+    if opinion is not None:
+        return opinion
+    return _fallback_opinion(judge, criterion_id, statute)
+
+
+# Case-insensitive scan so the prosecutor argument is searched in place, without a lowered copy.
+_SECURITY_CLAIM_RE = re.compile("security|vulnerability", re.IGNORECASE)
 
 
 def _clamp_score(score: int | float) -> int:
     return max(1, min(5, int(round(score))))
 
 
-def _missing_or_unfound_citations(opinion: JudicialOpinion, state: AgentState) -> list[str]:
-    missing: list[str] = []
-    for evidence_id in opinion.cited_evidence:
-        ev = state["evidences"].get(evidence_id)
-        if ev is None or not ev.found:
-            missing.append(evidence_id)
-    return missing
-
+def _missing_or_unfound_citations(opinion: JudicialOpinion, found_ids: set[str]) -> list[str]:
+    return [evidence_id for evidence_id in opinion.cited_evidence if evidence_id not in found_ids]
 
-def _default_remediation_for_criterion(criterion_id: str, criterion_name: str) -> list[str]:
-    cid = (criterion_id or "").lower()
-    cname = (criterion_name or "").lower()
 
-    if "git_forensic" in cid or "git" in cname:
-        return [
+# Ordered (criterion-id keys, criterion-name keys, remediation); the first matching rule wins.
+_REMEDIATION_RULES: tuple[tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]], ...] = (
+    (
+        ("git_forensic",),
+        ("git",),
+        (
             "Strengthen commit hygiene: keep atomic feature commits with clear scope prefixes and rationale in commit messages.",
             "Add a short engineering timeline section in README linking major architecture milestones to commit hashes.",
-        ]
-    if "state_management" in cid or "state" in cname:
-        return [
+        ),
+    ),
+    (
+        ("state_management",),
+        ("state",),
+        (
             "Tighten state contracts in src/state.py and src/models.py with explicit reducer semantics and field-level constraints.",
             "Add state-concurrency tests to verify list/dict reducers preserve parallel writes without overwrite.",
-        ]
-    if "graph_orchestration" in cid or "orchestration" in cname or "architecture" in cname:
-        return [
+        ),
+    ),
+    (
+        ("graph_orchestration",),
+        ("orchestration", "architecture"),
+        (
             "Keep explicit fan-out/fan-in edges and conditional error branches in src/graph.py (clone_failure, missing_evidence, malformed_outputs).",
             "Add graph execution tests that assert branch reachability and successful end-to-end compilation.",
-        ]
-    if "safe_tool" in cid or "security" in cname:
-        return [
+        ),
+    ),
+    (
+        ("safe_tool",),
+        ("security",),
+        (
             "Harden tool safety in src/tools/repo_tools.py: keep sandboxed tempfile clone, check return codes, and avoid shell execution primitives.",
             "Standardize error envelopes for subprocess and clone failures with explicit reason/action tags in Evidence content.",
-        ]
-    if "structured_output" in cid or "structured output" in cname:
-        return [
+        ),
+    ),
+    (
+        ("structured_output",),
+        ("structured output",),
+        (
             "Enforce schema-bound judge outputs in src/nodes/judges.py with with_structured_output(JudicialOpinion) and parse-failure retries.",
             "Log malformed output causes and fallback path selection for traceability.",
-        ]
-    if "judicial_nuance" in cid or "dialectic" in cname or "nuance" in cname:
-        return [
+        ),
+    ),
+    (
+        ("judicial_nuance",),
+        ("dialectic", "nuance"),
+        (
             "Increase persona separation in src/nodes/judges.py by strengthening prompt distinctions and evidence-citation discipline.",
             "Track judge disagreement metrics and flag high prompt-similarity cases to reduce persona collusion.",
-        ]
-    if "chief_justice" in cid or "synthesis" in cname:
-        return [
+        ),
+    ),
+    (
+        ("chief_justice",),
+        ("synthesis",),
+        (
             "Expand deterministic rule traces in src/nodes/justice.py (before/after score, rule applied, and affected evidence ids per criterion).",
             "Expose dissent rationale and rule-application summaries directly in the final report for auditability.",
-        ]
-    if "theoretical_depth" in cid or "documentation" in cname:
-        return [
+        ),
+    ),
+    (
+        ("theoretical_depth",),
+        ("documentation",),
+        (
             "Deepen documentation by mapping concepts (Dialectical Synthesis, Fan-In/Fan-Out, Metacognition) to concrete modules and edges.",
             "Add a concept-to-implementation table in reports/final_report.pdf for peer verification.",
-        ]
-    if "report_accuracy" in cid or "cross-reference" in cname:
-        return [
+        ),
+    ),
+    (
+        ("report_accuracy",),
+        ("cross-reference",),
+        (
             "Run citation cross-reference checks before submission and remove non-existent file claims from report narratives.",
             "Add CI validation that all report-mentioned paths exist in the audited commit.",
-        ]
-    if "swarm_visual" in cid or "diagram" in cname or "visual" in cname:
-        return [
+        ),
+    ),
+    (
+        ("swarm_visual",),
+        ("diagram", "visual"),
+        (
             "Regenerate architecture diagrams from the current compiled graph and ensure error branches are visually explicit.",
             "Keep diagram labels synchronized with node names in src/graph.py to prevent drift.",
-        ]
+        ),
+    ),
+)
+_DEFAULT_REMEDIATION: tuple[str, ...] = (
+    "Review criterion evidence and align implementation with rubric success patterns.",
+    "Add targeted tests and report notes demonstrating closure of the identified gap.",
+)
 
-    return [
-        "Review criterion evidence and align implementation with rubric success patterns.",
-        "Add targeted tests and report notes demonstrating closure of the identified gap.",
-    ]
+
+@lru_cache(maxsize=128)
+def _default_remediation_for_criterion(criterion_id: str, criterion_name: str) -> tuple[str, ...]:
+    cid = (criterion_id or "").lower()
+    cname = (criterion_name or "").lower()
+    for cid_keys, name_keys, remediation in _REMEDIATION_RULES:
+        if any(key in cid for key in cid_keys) or any(key in cname for key in name_keys):
+            return remediation
+    return _DEFAULT_REMEDIATION
+
+
+# Per-criterion facts that depend only on the rubric, resolved once per rubric object:
+# (id, name, statute, functionality_weighted, security_criterion, base remediation).
+_CriterionPlan = tuple[str, str, Statute, bool, bool, tuple[str, ...]]
+_criteria_plan_memo: tuple[list, tuple[_CriterionPlan, ...]] | None = None
+
+
+def _criteria_plan(criteria: list) -> tuple[_CriterionPlan, ...]:
+    global _criteria_plan_memo
+    memo = _criteria_plan_memo
+    if memo is not None and memo[0] is criteria:
+        return memo[1]
+    plan = []
+    for criterion in criteria:
+        criterion_id = criterion.get("id", "unknown_criterion")
+        criterion_name = criterion.get("name", criterion_id)
+        remediation = tuple(
+            criterion.get("remediation_templates")
+            or criterion.get("remediation")
+            or ()
+        ) or _default_remediation_for_criterion(criterion_id, criterion_name)
+        plan.append(
+            (
+                criterion_id,
+                criterion_name,
+                _coerce_statute(criterion.get("statute")),
+                "orchestration" in criterion_id.lower() or "architecture" in criterion_name.lower(),
+                "security" in criterion_id.lower(),
+                remediation,
+            )
+        )
+    _criteria_plan_memo = (criteria, tuple(plan))
+    return _criteria_plan_memo[1]
 
 
 def chief_justice_node(state: AgentState) -> dict:
-    opinions_by_criterion: dict[str, list[JudicialOpinion]] = defaultdict(list)
+    by_criterion_judge: dict[tuple[str, str], JudicialOpinion] = {}
     for opinion in state["opinions"]:
-        opinions_by_criterion[opinion.criterion_id].append(opinion)
+        by_criterion_judge[(opinion.criterion_id, opinion.judge)] = opinion
 
     criteria = state["rubric"].get("dimensions") or state["rubric"].get("criteria") or []
     breakdown: list[CriterionBreakdown] = []
@@ -103,47 +204,18 @@ def chief_justice_node(state: AgentState) -> dict:
     aggregate_scores: list[int] = []
     security_override_triggered = False
 
-    security_evidence = state["evidences"].get("repo.security_scan")
+    evidences = state["evidences"]
+    found_ids = {evidence_id for evidence_id, ev in evidences.items() if ev.found}
+    security_evidence = evidences.get("repo.security_scan")
 
-    for criterion in criteria:
-        criterion_id = criterion.get("id", "unknown_criterion")
-        criterion_name = criterion.get("name", criterion_id)
-        statute = _coerce_statute(criterion.get("statute"))
-        criterion_ops = opinions_by_criterion.get(criterion_id, [])
-
-        by_judge = {op.judge: op for op in criterion_ops}
-        prosecutor = by_judge.get("Prosecutor")
-        defense = by_judge.get("Defense")
-        tech_lead = by_judge.get("TechLead")
+    for criterion_id, criterion_name, statute, functionality_weighted, security_criterion, base_remediation in (
+        _criteria_plan(criteria)
+    ):
 
         # Normalize missing judges to deterministic fallback opinions.
-        if prosecutor is None:
-            prosecutor = JudicialOpinion(
-                judge="Prosecutor",
-                criterion_id=criterion_id,
-                statute=statute,
-                score=1,
-                argument="Missing Prosecutor opinion; defaulting to strict score.",
-                cited_evidence=[],
-            )
-        if defense is None:
-            defense = JudicialOpinion(
-                judge="Defense",
-                criterion_id=criterion_id,
-                statute=statute,
-                score=1,
-                argument="Missing Defense opinion; defaulting to minimal score.",
-                cited_evidence=[],
-            )
-        if tech_lead is None:
-            tech_lead = JudicialOpinion(
-                judge="TechLead",
-                criterion_id=criterion_id,
-                statute=statute,
-                score=1,
-                argument="Missing TechLead opinion; defaulting to minimal score.",
-                cited_evidence=[],
-            )
+        prosecutor = _opinion_or_fallback(by_criterion_judge, criterion_id, "Prosecutor", statute)
+        defense = _opinion_or_fallback(by_criterion_judge, criterion_id, "Defense", statute)
+        tech_lead = _opinion_or_fallback(by_criterion_judge, criterion_id, "TechLead", statute)
 
         judge_opinions = [prosecutor, defense, tech_lead]
         scores = [op.score for op in judge_opinions]
@@ -154,22 +226,21 @@ def chief_justice_node(state: AgentState) -> dict:
         base_score = _clamp_score(sum(scores) / 3)
 
         # Rule of Functionality: architecture criterion is weighted by Tech Lead.
-        if "orchestration" in criterion_id.lower() or "architecture" in criterion_name.lower():
+        if functionality_weighted:
             base_score = _clamp_score((tech_lead.score * 2 + prosecutor.score + defense.score) / 4)
             violated_rules.append("functionality_weight")
 
         # Rule of Evidence (fact supremacy): unsupported defense claims are overruled.
-        invalid_defense_citations = _missing_or_unfound_citations(defense, state)
+        invalid_defense_citations = _missing_or_unfound_citations(defense, found_ids)
         if invalid_defense_citations:
             base_score = _clamp_score((prosecutor.score + tech_lead.score) / 2)
             violated_rules.append("fact_supremacy")
 
         # Rule of Security: confirmed vulnerability caps score at 3.
         security_claimed = (
-            "security" in prosecutor.argument.lower()
-            or "vulnerability" in prosecutor.argument.lower()
+            _SECURITY_CLAIM_RE.search(prosecutor.argument) is not None
             or "repo.security_scan" in prosecutor.cited_evidence
-            or "security" in criterion_id.lower()
+            or security_criterion
         )
         if security_evidence is not None and not security_evidence.found and security_claimed:
             base_score = min(base_score, 3)
@@ -179,14 +250,11 @@ def chief_justice_node(state: AgentState) -> dict:
         # Variance re-evaluation rule.
         if variance > 2:
             violated_rules.append("variance_re_evaluation")
-            prosecutor_cites = set(prosecutor.cited_evidence)
-            defense_cites = set(defense.cited_evidence)
-            tech_cites = set(tech_lead.cited_evidence)
-            shared_cites = sorted(prosecutor_cites & defense_cites & tech_cites)
-            valid_shared = [
-                evidence_id for evidence_id in shared_cites if state["evidences"].get(evidence_id, None) and state["evidences"][evidence_id].found
-            ]
-            if valid_shared:
+            # Only whether any citation shared by all three judges is found matters here.
+            shared_found = found_ids.intersection(
+                prosecutor.cited_evidence, defense.cited_evidence, tech_lead.cited_evidence
+            )
+            if shared_found:
                 base_score = _clamp_score((base_score + tech_lead.score) / 2)
 
         if variance > 2:
@@ -202,13 +270,7 @@ def chief_justice_node(state: AgentState) -> dict:
             )
         dissent_log.append(f"{criterion_id}: {dissent}")
 
-        remediation = list(
-            criterion.get("remediation_templates")
-            or criterion.get("remediation")
-            or []
-        )
-        if not remediation:
-            remediation = _default_remediation_for_criterion(criterion_id, criterion_name)
+        remediation = list(base_remediation)
         if invalid_defense_citations:
             remediation.append(
                 "Align defense claims with concrete evidence ids; remove unsupported arguments from judge prompts."
@@ -221,8 +283,10 @@ def chief_justice_node(state: AgentState) -> dict:
         remediation_plan[criterion_id] = remediation
         aggregate_scores.append(base_score)
 
+        # Every field is already typed and bounded here (scores pass through _clamp_score and
+        # opinions were validated when judged), so skip re-validating the nested models.
         breakdown.append(
-            CriterionBreakdown(
+            CriterionBreakdown.model_construct(
                 criterion_id=criterion_id,
                 criterion_name=criterion_name,
                 statute=statute,
@@ -250,14 +314,14 @@ def chief_justice_node(state: AgentState) -> dict:
     if security_override_triggered:
         summary_parts.append("Rule of Security triggered: aggregate score capped at 3.0.")
 
-    report = AuditReport(
+    report = AuditReport.model_construct(
         repo_target=state["repo_url"],
-        generated_at=datetime.now(timezone.utc).isoformat(),
+        generated_at=datetime.now(_UTC).isoformat(timespec="seconds"),
         executive_summary=" ".join(summary_parts),
         aggregate_score=aggregate_score,
         criterion_breakdown=breakdown,
         remediation_plan=remediation_plan,
-        evidence_index=list(state["evidences"].values()),
+        evidence_index=list(evidences.values()),
         dissent_log=dissent_log,
     )
     final_report = render_audit_report_markdown(report)
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import os
-import urllib.error
-import urllib.request
+from functools import lru_cache
 from typing import Literal
 
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
+from .. import json_compat, ollama_http
 from ..state import AgentState
+from .detectives import found_evidence_counts, found_evidence_flags
 
 
 class _PreRouteOut(BaseModel):
@@ -23,11 +22,10 @@ class _PostRouteOut(BaseModel):
     rationale: str
 
 
-def _maybe_ollama_pre_route(state: AgentState) -> _PreRouteOut | None:
+async def _maybe_ollama_pre_route(state: AgentState) -> _PreRouteOut | None:
     model = os.getenv("OLLAMA_MODEL")
     if not model:
         return None
-    base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434").rstrip("/")
     payload = {
         "model": model,
         "stream": False,
@@ -49,44 +47,63 @@ def _maybe_ollama_pre_route(state: AgentState) -> _PreRouteOut | None:
         ],
         "options": {"temperature": 0},
     }
-    req = urllib.request.Request(
-        f"{base_url}/api/chat",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            raw = resp.read().decode("utf-8")
-        content = json.loads(raw).get("message", {}).get("content", "")
+        content = await ollama_http.chat(payload)
         if not content:
             return None
         return _PreRouteOut.model_validate_json(content)
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, ValueError):
+    except (ollama_http.Error, json_compat.JSONDecodeError, ValueError):
         return None
 
 
-def _maybe_ollama_post_route(state: AgentState) -> _PostRouteOut | None:
+def _post_route_flags(state: AgentState) -> tuple[bool, bool, bool]:
+    # Found flags come from the evidence_found_counts channel; only the clone-failure tag
+    # still needs a scan, and it stops at the first hit.
+    has_repo, has_doc = found_evidence_flags(state)
+    has_clone_failure = any(
+        "repo_access_error" in ev.tags for ev_id, ev in state["evidences"].items() if ev_id.startswith("repo.")
+    )
+    return has_repo, has_doc, has_clone_failure
+
+
+def _post_route_summary(state: AgentState, has_repo: bool, has_doc: bool, has_clone_failure: bool) -> str:
+    # The router only needs completeness hints, so evidence is reduced to a few counts; a
+    # per-item listing grows the prompt (and the model latency) with every detective check.
+    counts = found_evidence_counts(state)
+    return json_compat.dumps(
+        {
+            "repo_url": state["repo_url"],
+            "pdf_path": state.get("pdf_path"),
+            "doc_required": bool(state.get("pdf_path")),
+            "repo_evidence_found": has_repo,
+            "doc_evidence_found": has_doc,
+            "clone_failure_detected": has_clone_failure,
+            "evidence": {
+                "total": len(state["evidences"]),
+                "found": sum(counts.values()),
+                "repo_found": counts.get("repo", 0),
+                "doc_found": counts.get("doc", 0),
+            },
+        }
+    )
+
+
+def _force_router_llm() -> bool:
+    return os.getenv("ORCH_FORCE_LLM", "").lower() in {"1", "true", "yes"}
+
+
+def _heuristic_post_branch(has_repo: bool, has_doc: bool, has_clone_failure: bool, doc_required: bool) -> str:
+    if has_clone_failure:
+        return "clone_failure"
+    if has_repo and (has_doc or not doc_required):
+        return "judicial"
+    return "missing_evidence"
+
+
+async def _maybe_ollama_post_route(summary: str) -> _PostRouteOut | None:
     model = os.getenv("OLLAMA_MODEL")
     if not model:
         return None
-    has_repo = any(ev_id.startswith("repo.") and ev.found for ev_id, ev in state["evidences"].items())
-    has_doc = any(ev_id.startswith("doc.") and ev.found for ev_id, ev in state["evidences"].items())
-    has_clone_failure = any(
-        ev_id.startswith("repo.") and "repo_access_error" in ev.tags
-        for ev_id, ev in state["evidences"].items()
-    )
-    doc_required = bool(state.get("pdf_path"))
-    summary = {
-        "repo_url": state["repo_url"],
-        "pdf_path": state.get("pdf_path"),
-        "doc_required": doc_required,
-        "repo_evidence_found": has_repo,
-        "doc_evidence_found": has_doc,
-        "clone_failure_detected": has_clone_failure,
-        "evidence": {k: v.model_dump() for k, v in state["evidences"].items()},
-    }
-    base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434").rstrip("/")
     payload = {
         "model": model,
         "stream": False,
@@ -99,7 +116,7 @@ def _maybe_ollama_post_route(state: AgentState) -> _PostRouteOut | None:
             {
                 "role": "user",
                 "content": (
-                    f"Evidence summary:\n{json.dumps(summary)}\n\n"
+                    f"Evidence summary:\n{summary}\n\n"
                     "Return JSON: {\"post_branch\": \"judicial\"|\"clone_failure\"|\"missing_evidence\", \"rationale\": \"...\"}\n"
                     "Choose clone_failure if repository access/clone failed. "
                     "Choose missing_evidence when required evidence is incomplete but clone did not fail. "
@@ -109,41 +126,44 @@ def _maybe_ollama_post_route(state: AgentState) -> _PostRouteOut | None:
         ],
         "options": {"temperature": 0},
     }
-    req = urllib.request.Request(
-        f"{base_url}/api/chat",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            raw = resp.read().decode("utf-8")
-        content = json.loads(raw).get("message", {}).get("content", "")
+        content = await ollama_http.chat(payload)
         if not content:
             return None
         return _PostRouteOut.model_validate_json(content)
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, ValueError):
+    except (ollama_http.Error, json_compat.JSONDecodeError, ValueError):
         return None
 
 
-def _build_router_llm():
+_ROUTER_ENV = (
+    "LLM_PROVIDER",
+    "GROK_API_KEY",
+    "GROK_MODEL",
+    "GROK_BASE_URL",
+    "DEEPSEEK_API_KEY",
+    "OPENAI_API_KEY",
+    "OPENAI_MODEL_OVERRIDE",
+    "OPENAI_MODEL",
+    "DEEPSEEK_API_BASE",
+)
+
+
+def _router_env() -> tuple[str | None, ...]:
+    # Both routers run once per graph pass; reuse the client while its configuration is unchanged.
+    return tuple(os.getenv(name) for name in _ROUTER_ENV)
+
+
+@lru_cache(maxsize=4)
+def _router_llm(env: tuple[str | None, ...]):
     provider = os.getenv("LLM_PROVIDER", "auto").lower()
-    if provider in {"auto", "ollama"}:
-        ollama_model = os.getenv("OLLAMA_MODEL")
-        if ollama_model:
-            try:
-                from langchain_ollama import ChatOllama
-
-                return ChatOllama(
-                    model=ollama_model,
-                    base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
-                    temperature=0.0,
-                )
-            except Exception:
-                if provider == "ollama":
-                    return None
+    # Ollama is always tried first through the raw JSON-mode call in _maybe_ollama_*_route;
+    # wrapping the same server in ChatOllama would only repeat a request that just failed.
+    if provider == "ollama":
+        return None
 
     if provider in {"auto", "grok"} and os.getenv("GROK_API_KEY"):
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             model=os.getenv("GROK_MODEL", "grok-2-latest"),
             api_key=os.getenv("GROK_API_KEY"),
@@ -154,6 +174,8 @@ def _build_router_llm():
     api_key = os.getenv("DEEPSEEK_API_KEY") or os.getenv("OPENAI_API_KEY")
     if not api_key:
         return None
+    from langchain_openai import ChatOpenAI
+
     model = os.getenv("OPENAI_MODEL_OVERRIDE") or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     base_url = os.getenv("DEEPSEEK_API_BASE", "https://api.deepseek.com/v1") if "deepseek" in model else None
     return ChatOpenAI(
@@ -164,11 +186,91 @@ def _build_router_llm():
     )
 
 
-def run_orchestration_precheck(state: AgentState) -> dict:
+_PRE_ROUTE_MESSAGES = (
+    (
+        "system",
+        "You are an orchestration router. Pick doc_branch based on input readiness.",
+    ),
+    (
+        "human",
+        "Repo URL: {repo_url}\nPDF Path: {pdf_path}\n"
+        "Choose doc_branch as 'doc_analyst' if a report is available, otherwise 'doc_skipped'.",
+    ),
+)
+
+_POST_ROUTE_MESSAGES = (
+    (
+        "system",
+        "You are an orchestration router. Choose post_branch using evidence completeness.",
+    ),
+    (
+        "human",
+        "Evidence summary:\n{summary}\n\n"
+        "Choose 'clone_failure' if repository access/clone failed. "
+        "Choose 'missing_evidence' when required evidence is incomplete but clone did not fail. "
+        "Choose 'judicial' only if repo evidence is sufficient and required doc evidence is present.",
+    ),
+)
+
+
+@lru_cache(maxsize=2)
+def _router_prompt(messages: tuple[tuple[str, str], ...]):
+    # Templates are parsed once per process; langchain_core stays a lazy import.
+    from langchain_core.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_messages(list(messages))
+
+
+@lru_cache(maxsize=8)
+def _router_chain(env: tuple[str | None, ...], messages: tuple[tuple[str, str], ...], schema: type[BaseModel]):
+    # Keyed on the same env snapshot as _router_llm, so the structured-output wrapper is
+    # rebuilt only when the router client itself is.
+    llm = _router_llm(env)
+    if llm is None:
+        return None
+    return _router_prompt(messages) | llm.with_structured_output(schema)
+
+
+# Router decisions are a pure function of what the prompt shows the model, so with
+# ROUTER_CACHE enabled a repeated input (CI retries, re-runs in one process) skips the call.
+_PRE_ROUTE_CACHE: dict[str, _PreRouteOut] = {}
+_POST_ROUTE_CACHE: dict[str, _PostRouteOut] = {}
+
+
+def _router_cache_enabled() -> bool:
+    return os.getenv("ROUTER_CACHE", "").lower() in {"1", "true", "yes"}
+
+
+def _router_cache_key(*parts: str | None) -> str | None:
+    if not _router_cache_enabled():
+        return None
+    return hashlib.blake2b(json_compat.dumpb(parts), digest_size=16).hexdigest()
+
+
+async def run_orchestration_precheck(state: AgentState) -> dict:
+    # The doc branch is fully decided by whether a PDF was supplied; the router is only
+    # consulted when ORCH_FORCE_LLM asks for it.
+    if not _force_router_llm():
+        branch = "doc_analyst" if state.get("pdf_path") else "doc_skipped"
+        return {
+            "routing": {"doc_branch": branch},
+            "logs": [f"OrchestrationPrecheck deterministic selected {branch}"],
+        }
+
+    cache_key = _router_cache_key(state["repo_url"], state.get("pdf_path"))
+    cached = _PRE_ROUTE_CACHE.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        return {
+            "routing": {"doc_branch": cached.doc_branch},
+            "logs": [f"OrchestrationPrecheck cached selected {cached.doc_branch}: {cached.rationale}"],
+        }
+
     provider = os.getenv("LLM_PROVIDER", "auto").lower()
     if provider in {"auto", "ollama"}:
-        ollama_out = _maybe_ollama_pre_route(state)
+        ollama_out = await _maybe_ollama_pre_route(state)
         if ollama_out is not None:
+            if cache_key is not None:
+                _PRE_ROUTE_CACHE[cache_key] = ollama_out
             return {
                 "routing": {"doc_branch": ollama_out.doc_branch},
                 "logs": [f"OrchestrationPrecheck llm selected {ollama_out.doc_branch}: {ollama_out.rationale}"],
@@ -180,36 +282,23 @@ def run_orchestration_precheck(state: AgentState) -> dict:
                 "logs": [f"OrchestrationPrecheck fallback selected {branch} (ollama unavailable)"],
             }
 
-    llm = _build_router_llm()
-    if llm is None:
+    chain = _router_chain(_router_env(), _PRE_ROUTE_MESSAGES, _PreRouteOut)
+    if chain is None:
         branch = "doc_analyst" if state.get("pdf_path") else "doc_skipped"
         return {
             "routing": {"doc_branch": branch},
             "logs": [f"OrchestrationPrecheck heuristic selected {branch}"],
         }
 
-    structured = llm.with_structured_output(_PreRouteOut)
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are an orchestration router. Pick doc_branch based on input readiness.",
-            ),
-            (
-                "human",
-                "Repo URL: {repo_url}\nPDF Path: {pdf_path}\n"
-                "Choose doc_branch as 'doc_analyst' if a report is available, otherwise 'doc_skipped'.",
-            ),
-        ]
-    )
-    chain = prompt | structured
     try:
-        out = chain.invoke(
+        out = await chain.ainvoke(
             {
                 "repo_url": state["repo_url"],
                 "pdf_path": state.get("pdf_path"),
             }
         )
+        if cache_key is not None:
+            _PRE_ROUTE_CACHE[cache_key] = out
         return {
             "routing": {"doc_branch": out.doc_branch},
             "logs": [f"OrchestrationPrecheck llm selected {out.doc_branch}: {out.rationale}"],
@@ -222,93 +311,70 @@ def run_orchestration_precheck(state: AgentState) -> dict:
         }
 
 
-def run_orchestration_postcheck(state: AgentState) -> dict:
-    has_repo = any(
-        ev_id.startswith("repo.") and ev.found
-        for ev_id, ev in state["evidences"].items()
-    )
-    has_doc = any(
-        ev_id.startswith("doc.") and ev.found
-        for ev_id, ev in state["evidences"].items()
-    )
-    has_clone_failure = any(
-        ev_id.startswith("repo.") and "repo_access_error" in ev.tags
-        for ev_id, ev in state["evidences"].items()
-    )
+async def run_orchestration_postcheck(state: AgentState) -> dict:
+    has_repo, has_doc, has_clone_failure = _post_route_flags(state)
     doc_required = bool(state.get("pdf_path"))
+    summary: str | None = None
+
+    # A clone failure or complete evidence fully determines the branch; only the ambiguous
+    # missing-evidence case is worth a router round-trip unless ORCH_FORCE_LLM asks for it.
+    heuristic_branch = _heuristic_post_branch(has_repo, has_doc, has_clone_failure, doc_required)
+    if heuristic_branch != "missing_evidence" and not _force_router_llm():
+        return {
+            "routing": {"post_branch": heuristic_branch},
+            "logs": [f"OrchestrationPostcheck deterministic selected {heuristic_branch}"],
+        }
+
+    cache_key = None
+    if _router_cache_enabled():
+        summary = _post_route_summary(state, has_repo, has_doc, has_clone_failure)
+        cache_key = _router_cache_key(summary)
+    cached = _POST_ROUTE_CACHE.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        return {
+            "routing": {"post_branch": cached.post_branch},
+            "logs": [f"OrchestrationPostcheck cached selected {cached.post_branch}: {cached.rationale}"],
+        }
 
     provider = os.getenv("LLM_PROVIDER", "auto").lower()
     if provider in {"auto", "ollama"}:
-        ollama_out = _maybe_ollama_post_route(state)
+        if summary is None and os.getenv("OLLAMA_MODEL"):
+            summary = _post_route_summary(state, has_repo, has_doc, has_clone_failure)
+        ollama_out = await _maybe_ollama_post_route(summary) if summary is not None else None
         if ollama_out is not None:
+            if cache_key is not None:
+                _POST_ROUTE_CACHE[cache_key] = ollama_out
             return {
                 "routing": {"post_branch": ollama_out.post_branch},
                 "logs": [f"OrchestrationPostcheck llm selected {ollama_out.post_branch}: {ollama_out.rationale}"],
             }
         if provider == "ollama":
-            if has_clone_failure:
-                post_branch = "clone_failure"
-            elif has_repo and (has_doc or not doc_required):
-                post_branch = "judicial"
-            else:
-                post_branch = "missing_evidence"
+            post_branch = heuristic_branch
             return {
                 "routing": {"post_branch": post_branch},
                 "logs": [f"OrchestrationPostcheck fallback selected {post_branch} (ollama unavailable)"],
             }
 
-    llm = _build_router_llm()
-    if llm is None:
-        if has_clone_failure:
-            post_branch = "clone_failure"
-        elif has_repo and (has_doc or not doc_required):
-            post_branch = "judicial"
-        else:
-            post_branch = "missing_evidence"
+    chain = _router_chain(_router_env(), _POST_ROUTE_MESSAGES, _PostRouteOut)
+    if chain is None:
+        post_branch = heuristic_branch
         return {
             "routing": {"post_branch": post_branch},
             "logs": [f"OrchestrationPostcheck heuristic selected {post_branch}"],
         }
 
-    structured = llm.with_structured_output(_PostRouteOut)
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are an orchestration router. Choose post_branch using evidence completeness.",
-            ),
-            (
-                "human",
-                "Evidence summary:\n{summary}\n\n"
-                "Choose 'clone_failure' if repository access/clone failed. "
-                "Choose 'missing_evidence' when required evidence is incomplete but clone did not fail. "
-                "Choose 'judicial' only if repo evidence is sufficient and required doc evidence is present.",
-            ),
-        ]
-    )
-    summary = {
-        "repo_url": state["repo_url"],
-        "pdf_path": state.get("pdf_path"),
-        "doc_required": doc_required,
-        "repo_evidence_found": has_repo,
-        "doc_evidence_found": has_doc,
-        "clone_failure_detected": has_clone_failure,
-        "evidence": {k: v.model_dump() for k, v in state["evidences"].items()},
-    }
-    chain = prompt | structured
+    if summary is None:
+        summary = _post_route_summary(state, has_repo, has_doc, has_clone_failure)
     try:
-        out = chain.invoke({"summary": json.dumps(summary)})
+        out = await chain.ainvoke({"summary": summary})
+        if cache_key is not None:
+            _POST_ROUTE_CACHE[cache_key] = out
         return {
             "routing": {"post_branch": out.post_branch},
             "logs": [f"OrchestrationPostcheck llm selected {out.post_branch}: {out.rationale}"],
         }
     except Exception:
-        if has_clone_failure:
-            post_branch = "clone_failure"
-        elif has_repo and (has_doc or not doc_required):
-            post_branch = "judicial"
-        else:
-            post_branch = "missing_evidence"
+        post_branch = heuristic_branch
         return {
             "routing": {"post_branch": post_branch},
             "logs": [f"OrchestrationPostcheck fallback selected {post_branch}"],
@@ -316,34 +382,40 @@ def run_orchestration_postcheck(state: AgentState) -> dict:
 
 
 def run_judicial_fanout(state: AgentState) -> dict:
-    return {"logs": ["JudicialFanout dispatched"]}
+    # Evidence is final once detectives fan in; dump it once for all three judges.
+    return {
+        "evidence_dump": {k: v.model_dump() for k, v in state["evidences"].items()},
+        "logs": ["JudicialFanout dispatched"],
+    }
 
 
 def run_judicial_integrity_check(state: AgentState) -> dict:
     criteria = state["rubric"].get("dimensions") or state["rubric"].get("criteria") or []
-    criterion_ids = {
+    criterion_ids = frozenset(
         str(item.get("id"))
         for item in criteria
         if isinstance(item, dict) and item.get("id")
-    }
+    )
 
-    malformed_reasons: list[str] = []
+    # Collected as a set: repeated causes (e.g. the same unknown id from all three judges)
+    # dedupe on insert instead of in a final pass.
+    malformed_reasons: set[str] = set()
     opinions = state.get("opinions", [])
     if not criterion_ids:
-        malformed_reasons.append("rubric_missing_criteria")
+        malformed_reasons.add("rubric_missing_criteria")
 
     for op in opinions:
         if op.criterion_id not in criterion_ids:
-            malformed_reasons.append(f"unknown_criterion_id:{op.criterion_id}")
+            malformed_reasons.add(f"unknown_criterion_id:{op.criterion_id}")
         if not (1 <= op.score <= 5):
-            malformed_reasons.append(f"invalid_score:{op.judge}:{op.criterion_id}:{op.score}")
+            malformed_reasons.add(f"invalid_score:{op.judge}:{op.criterion_id}:{op.score}")
 
     expected = len(criterion_ids) * 3 if criterion_ids else 0
     if expected and len(opinions) < expected:
-        malformed_reasons.append(f"incomplete_judicial_output:expected={expected},actual={len(opinions)}")
+        malformed_reasons.add(f"incomplete_judicial_output:expected={expected},actual={len(opinions)}")
 
     branch = "malformed_outputs_handler" if malformed_reasons else "chief_justice"
-    detail = ", ".join(sorted(set(malformed_reasons))) if malformed_reasons else "all_opinions_well_formed"
+    detail = ", ".join(sorted(malformed_reasons)) if malformed_reasons else "all_opinions_well_formed"
     return {
         "routing": {"judicial_branch": branch},
         "logs": [f"JudicialIntegrityCheck selected {branch}: {detail}"],
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+import httpx
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+from . import json_compat
+
+Error = httpx.HTTPError
+
+# Shared by the orchestration routers and every judge so all Ollama calls reuse keep-alive
+# connections. One pooled client per event loop; httpx connection pools cannot cross loops.
+_LIMITS = httpx.Limits(max_connections=512, max_keepalive_connections=256)
+_client_slot: tuple[asyncio.AbstractEventLoop, str, httpx.AsyncClient] | None = None
+
+
+def client() -> httpx.AsyncClient:
+    global _client_slot
+    loop = asyncio.get_running_loop()
+    base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434").rstrip("/")
+    cached = _client_slot
+    if cached is None or cached[0] is not loop or cached[1] != base_url:
+        pooled = httpx.AsyncClient(base_url=base_url, limits=_LIMITS, timeout=httpx.Timeout(60.0))
+        cached = _client_slot = (loop, base_url, pooled)
+    return cached[2]
+
+
+async def aclose() -> None:
+    global _client_slot
+    cached, _client_slot = _client_slot, None
+    if cached is not None:
+        await cached[2].aclose()
+
+
+def _transient(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    # A refused connection means no local Ollama server; retrying only delays the fallback.
+    return isinstance(exc, httpx.TransportError) and not isinstance(exc, httpx.ConnectError)
+
+
+async def chat(payload: dict) -> str:
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(1, 8),
+        retry=retry_if_exception(_transient),
+        reraise=True,
+    ):
+        with attempt:
+            resp = await client().post(
+                "/api/chat",
+                content=json_compat.dumpb(payload),
+                headers={"Content-Type": "application/json"},
+            )
+            resp.raise_for_status()
+    return json_compat.loads(resp.content).get("message", {}).get("content", "")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+import os
 from pathlib import Path
 
 from .models import AuditReport, Evidence
@@ -12,149 +14,147 @@ def render_detective_report(
     logs: list[str],
     output_path: str,
 ) -> str:
-    lines: list[str] = []
-    lines.append("# Interim Detective Audit Report")
-    lines.append("")
-    lines.append("## Input")
-    lines.append("")
-    lines.append(f"- Repository Target: `{repo_url}`")
-    lines.append(f"- PDF Report: `{pdf_path or 'N/A'}`")
-    lines.append("")
-    lines.append("## Evidence Index")
-    lines.append("")
-
-    for evidence_id in sorted(evidences.keys()):
-        ev = evidences[evidence_id]
-        lines.append(f"### {evidence_id}")
-        lines.append(f"- Goal: {ev.goal}")
-        lines.append(f"- Found: `{ev.found}`")
-        lines.append(f"- Confidence: `{ev.confidence:.2f}`")
-        lines.append(f"- Location: `{ev.location}`")
-        lines.append(f"- Rationale: {ev.rationale}")
-        if ev.content:
-            lines.append("- Content:")
-            lines.append("```text")
-            lines.append(ev.content)
-            lines.append("```")
-        if ev.tags:
-            lines.append(f"- Tags: {', '.join(ev.tags)}")
-        lines.append("")
-
-    lines.append("## Execution Log")
-    lines.append("")
-    for log in logs:
-        lines.append(f"- {log}")
-
-    content = "\n".join(lines) + "\n"
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(content, encoding="utf-8")
-    return content
+    with out.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.write(
+            "# Interim Detective Audit Report\n"
+            "\n"
+            "## Input\n"
+            "\n"
+            f"- Repository Target: `{repo_url}`\n"
+            f"- PDF Report: `{pdf_path or 'N/A'}`\n"
+            "\n"
+            "## Evidence Index\n"
+            "\n"
+        )
+
+        # Evidence keeps the detectives' insertion order (see AgentState.evidences); sorting by id
+        # is opt-in through REPORT_SORTED.
+        items = evidences.items()
+        if os.getenv("REPORT_SORTED", "").lower() in {"1", "true", "yes"}:
+            items = sorted(items, key=lambda item: item[0])
+        for evidence_id, ev in items:
+            fh.write(
+                f"### {evidence_id}\n"
+                f"- Goal: {ev.goal}\n"
+                f"- Found: `{ev.found}`\n"
+                f"- Confidence: `{ev.confidence:.2f}`\n"
+                f"- Location: `{ev.location}`\n"
+                f"- Rationale: {ev.rationale}\n"
+            )
+            if ev.content:
+                fh.write(f"- Content:\n```text\n{ev.content}\n```\n")
+            if ev.tags:
+                fh.write(f"- Tags: {', '.join(ev.tags)}\n")
+            fh.write("\n")
+
+        fh.write("## Execution Log\n\n")
+        for log in logs:
+            fh.write(f"- {log}\n")
+    return str(out)
+
+
+_JUDGE_ORDER = {"Defense": 0, "Prosecutor": 1, "TechLead": 2}
+_OPTIONAL_REMEDIATION = "Optional optimization: tighten edge-case handling and add stronger validation/tests."
+_GAP_REMEDIATION = "Address evidence gaps and re-run audit."
 
 
 def render_audit_report_markdown(report: AuditReport) -> str:
-    total = len(report.criterion_breakdown)
-    excellent = sum(1 for c in report.criterion_breakdown if c.final_score == 5)
-    good = sum(1 for c in report.criterion_breakdown if 3 <= c.final_score <= 4)
-    needs_improvement = sum(1 for c in report.criterion_breakdown if c.final_score <= 2)
-
-    lines: list[str] = []
-    lines.append(f"# Peer Audit Final Result: {report.repo_target}")
-    lines.append("")
-    lines.append("## Executive Summary")
-    lines.append("")
-    lines.append(
+    breakdown = report.criterion_breakdown
+    total = len(breakdown)
+    excellent = good = needs_improvement = 0
+    for c in breakdown:
+        if c.final_score == 5:
+            excellent += 1
+        elif 3 <= c.final_score <= 4:
+            good += 1
+        elif c.final_score <= 2:
+            needs_improvement += 1
+
+    # Written as multi-line chunks into one buffer, like render_detective_report, instead of
+    # a list entry per line joined at the end.
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        f"# Peer Audit Final Result: {report.repo_target}\n"
+        "\n"
+        "## Executive Summary\n"
+        "\n"
         f"Overall Score: {report.aggregate_score:.2f}/5.0. "
         f"Criteria Evaluated: {total}. Excellent (5): {excellent}, "
         f"Good (3-4): {good}, Needs Improvement (1-2): {needs_improvement}. "
-        "Ready for staging with minor refinements."
+        "Ready for staging with minor refinements.\n"
+        "\n"
+        f"**Overall Score:** {report.aggregate_score:.2f}/5.0\n"
+        "\n"
+        "## Criterion Breakdown\n"
+        "\n"
     )
-    lines.append("")
-    lines.append(f"**Overall Score:** {report.aggregate_score:.2f}/5.0")
-    lines.append("")
-    lines.append("## Criterion Breakdown")
-    lines.append("")
-
-    for criterion in report.criterion_breakdown:
-        lines.append(f"### {criterion.criterion_name}")
-        lines.append(f"**Final Score:** {criterion.final_score}/5")
-        lines.append("")
-        lines.append("**Judge Opinions:**")
-        lines.append("")
-
-        def _judge_key(judge_name: str) -> int:
-            order = {"Defense": 0, "Prosecutor": 1, "TechLead": 2}
-            return order.get(judge_name, 99)
-
-        for opinion in sorted(criterion.judge_opinions, key=lambda op: _judge_key(op.judge)):
+
+    for criterion in breakdown:
+        w(
+            f"### {criterion.criterion_name}\n"
+            f"**Final Score:** {criterion.final_score}/5\n"
+            "\n"
+            "**Judge Opinions:**\n"
+            "\n"
+        )
+        for opinion in sorted(criterion.judge_opinions, key=lambda op: _JUDGE_ORDER.get(op.judge, 99)):
             cited = ", ".join(opinion.cited_evidence) if opinion.cited_evidence else "none"
-            lines.append(f"- **{opinion.judge}** (Score: {opinion.score}): {opinion.argument}")
-            lines.append(f"  - Cited: {cited}")
-            lines.append("")
+            w(f"- **{opinion.judge}** (Score: {opinion.score}): {opinion.argument}\n  - Cited: {cited}\n\n")
 
         if criterion.final_score == 5:
             remediation = "No remediation required."
         elif criterion.final_score == 4:
-            remediation = (
-                criterion.remediation[0]
-                if criterion.remediation
-                else "Optional optimization: tighten edge-case handling and add stronger validation/tests."
-            )
+            remediation = criterion.remediation[0] if criterion.remediation else _OPTIONAL_REMEDIATION
         else:
-            remediation = criterion.remediation[0] if criterion.remediation else "Address evidence gaps and re-run audit."
-        lines.append(f"**Remediation:** {remediation}")
+            remediation = criterion.remediation[0] if criterion.remediation else _GAP_REMEDIATION
+        w(f"**Remediation:** {remediation}\n")
         if criterion.violated_rules:
-            lines.append(f"**Deterministic Rules Applied:** {', '.join(criterion.violated_rules)}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+            w(f"**Deterministic Rules Applied:** {', '.join(criterion.violated_rules)}\n")
+        w("\n---\n\n")
 
-    lines.append("## Remediation Plan")
-    lines.append("")
-    lines.append("# Prioritized Remediation Plan")
-    lines.append("")
+    w("## Remediation Plan\n\n# Prioritized Remediation Plan\n\n")
 
     must_fix = sorted(
-        [c for c in report.criterion_breakdown if c.final_score <= 3],
+        [c for c in breakdown if c.final_score <= 3],
         key=lambda c: (c.final_score, c.criterion_id),
     )
     optimize = sorted(
-        [c for c in report.criterion_breakdown if c.final_score == 4],
+        [c for c in breakdown if c.final_score == 4],
         key=lambda c: c.criterion_id,
     )
 
     if must_fix:
         for idx, criterion in enumerate(must_fix, start=1):
-            lines.append(f"## Priority {idx}: {criterion.criterion_name} (Score: {criterion.final_score}/5)")
-            top_item = criterion.remediation[0] if criterion.remediation else "Address evidence gaps and re-run audit."
-            lines.append(f"⚠️ **Issue:** {top_item}")
-            lines.append("")
+            top_item = criterion.remediation[0] if criterion.remediation else _GAP_REMEDIATION
+            w(
+                f"## Priority {idx}: {criterion.criterion_name} (Score: {criterion.final_score}/5)\n"
+                f"⚠️ **Issue:** {top_item}\n"
+                "\n"
+            )
     else:
-        lines.append("No blocking remediation items (all criteria scored 4/5 or above).")
-        lines.append("")
+        w("No blocking remediation items (all criteria scored 4/5 or above).\n\n")
 
     if optimize:
-        lines.append("## Optimization Backlog (Non-Blocking)")
-        lines.append("")
+        w("## Optimization Backlog (Non-Blocking)\n\n")
         for criterion in optimize:
-            lines.append(f"- {criterion.criterion_name} (4/5):")
-            top_item = (
-                criterion.remediation[0]
-                if criterion.remediation
-                else "Optional optimization: tighten edge-case handling and add stronger validation/tests."
-            )
-            lines.append(f"  {top_item}")
-        lines.append("")
-
-    lines.append("---")
-    lines.append("*Remediation priorities based on: score severity, security impact, and production readiness*")
-    lines.append("")
-    lines.append("---")
-    lines.append("*Report generated by Automaton Auditor Swarm v3.0.0*")
-    lines.append(f"*Timestamp: {report.generated_at or 'N/A'}*")
-    lines.append(f"*Methodology: {report.methodology}*")
-
-    return "\n".join(lines).rstrip() + "\n"
+            top_item = criterion.remediation[0] if criterion.remediation else _OPTIONAL_REMEDIATION
+            w(f"- {criterion.criterion_name} (4/5):\n  {top_item}\n")
+        w("\n")
+
+    w(
+        "---\n"
+        "*Remediation priorities based on: score severity, security impact, and production readiness*\n"
+        "\n"
+        "---\n"
+        "*Report generated by Automaton Auditor Swarm v3.0.0*\n"
+        f"*Timestamp: {report.generated_at or 'N/A'}*\n"
+        f"*Methodology: {report.methodology}*"
+    )
+
+    return buf.getvalue().rstrip() + "\n"
 
 
 def write_report(path: str, content: str) -> None:
@@ -6,11 +6,26 @@ from typing import Annotated, TypedDict
 from .models import AuditReport, Evidence, JudicialOpinion
 
 
+def merge_counts(left: dict[str, int], right: dict[str, int]) -> dict[str, int]:
+    merged = dict(left)
+    for key, count in right.items():
+        merged[key] = merged.get(key, 0) + count
+    return merged
+
+
 class AgentState(TypedDict):
     repo_url: str
     pdf_path: str | None
     rubric: dict
+    # Iteration order is the detectives' insertion order: each detective adds its checks in a
+    # fixed sequence and LangGraph applies parallel writes in a stable task order.
     evidences: Annotated[dict[str, Evidence], operator.ior]
+    # Found-evidence counts per id namespace ("repo", "doc"), maintained by detectives.
+    evidence_found_counts: Annotated[dict[str, int], merge_counts]
+    # Plain-dict dump of evidences, written once at judicial fan-out and shared by all judges.
+    evidence_dump: dict[str, dict]
+    # The three judges run in one superstep and only write opinions/logs; both channels must
+    # keep additive reducers so their updates merge instead of conflicting.
     opinions: Annotated[list[JudicialOpinion], operator.add]
     routing: Annotated[dict[str, str], operator.ior]
     logs: Annotated[list[str], operator.add]
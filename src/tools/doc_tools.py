@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import base64
+import heapq
 import os
 import re
 import unicodedata
+from collections.abc import Sequence
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 
 from langchain_core.messages import HumanMessage
@@ -13,8 +16,20 @@ from pypdf import PdfReader
 
 from ..state import Evidence
 
+_QUERY_TOKEN_RE = re.compile(r"[a-zA-Z0-9_-]+")
+_CITED_PATH_RE = re.compile(r"\b(?:src|tests|audit|reports)/[\w./-]+/?")
+_PATH_PROSE_SUFFIX_RE = re.compile(r"(\.(?:py|md|json|ya?ml|txt))(?:-[a-z][\w-]*)+")
+_FUSED_PATHS_RE = re.compile(r"^(.*\.(?:py|md|json|ya?ml|txt))(?:/src/.*)$")
 
-def _read_pdf_text(report_path: str) -> str:
+
+def _read_pdf_text_pymupdf(report_path: str) -> str:
+    import fitz
+
+    with fitz.open(report_path) as doc:
+        return "\n".join(page.get_text() for page in doc)
+
+
+def _read_pdf_text_pypdf(report_path: str) -> str:
     reader = PdfReader(report_path)
     pages = []
     for page in reader.pages:
@@ -22,42 +37,68 @@ def _read_pdf_text(report_path: str) -> str:
     return "\n".join(pages)
 
 
-def ingest_pdf(path: str, chunk_size: int = 1200, overlap: int = 150) -> list[str]:
-    text = _read_pdf_text(path).strip()
+@lru_cache(maxsize=16)
+def _read_pdf_text(report_path: str, mtime: float = 0.0) -> str:
+    # mtime is part of the cache key only, so an edited report is re-parsed.
+    # PyMuPDF (already required for the visual audit) extracts text natively and much faster
+    # than pypdf; keep pypdf as the fallback for files MuPDF rejects.
+    try:
+        return _read_pdf_text_pymupdf(report_path)
+    except Exception:
+        return _read_pdf_text_pypdf(report_path)
+
+
+@lru_cache(maxsize=16)
+def _ingest_pdf_cached(path: str, mtime: float, chunk_size: int, overlap: int) -> tuple[str, ...]:
+    text = _read_pdf_text(path, mtime).strip()
     if not text:
-        return []
+        return ()
 
-    chunks: list[str] = []
     step = max(1, chunk_size - overlap)
-    for i in range(0, len(text), step):
-        chunk = text[i : i + chunk_size].strip()
-        if chunk:
-            chunks.append(chunk)
-    return chunks
+    stripped = (text[i : i + chunk_size].strip() for i in range(0, len(text), step))
+    return tuple(chunk for chunk in stripped if chunk)
 
 
-def query_pdf_chunks(chunks: list[str], query: str, top_k: int = 3) -> list[str]:
-    tokens = [t for t in re.findall(r"[a-zA-Z0-9_-]+", query.lower()) if len(t) > 2]
+def ingest_pdf(path: str, chunk_size: int = 1200, overlap: int = 150) -> tuple[str, ...]:
+    return _ingest_pdf_cached(path, os.path.getmtime(path), chunk_size, overlap)
+
+
+@lru_cache(maxsize=16)
+def _lowered_chunks(chunks: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(chunk.lower() for chunk in chunks)
+
+
+def query_pdf_chunks(chunks: Sequence[str], query: str, top_k: int = 3) -> list[str]:
+    tokens = [t for t in _QUERY_TOKEN_RE.findall(query.lower()) if len(t) > 2]
     if not chunks or not tokens:
         return []
 
-    scored: list[tuple[int, str]] = []
-    for chunk in chunks:
-        lower = chunk.lower()
+    if top_k <= 0:
+        return []
+
+    chunks = tuple(chunks)
+    # Bounded min-heap of (score, -index, chunk); on equal scores the earlier chunk wins,
+    # matching the previous stable sort.
+    heap: list[tuple[int, int, str]] = []
+    for idx, (chunk, lower) in enumerate(zip(chunks, _lowered_chunks(chunks))):
         score = sum(lower.count(token) for token in tokens)
-        if score > 0:
-            scored.append((score, chunk))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [chunk for _, chunk in scored[:top_k]]
+        if score <= 0:
+            continue
+        if len(heap) < top_k:
+            heapq.heappush(heap, (score, -idx, chunk))
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, (score, -idx, chunk))
+    heap.sort(key=lambda item: (-item[0], -item[1]))
+    return [chunk for _, _, chunk in heap]
 
 
 def _normalize_cited_path(raw: str) -> str:
     token = unicodedata.normalize("NFKC", raw.strip().strip("`'\""))
     # Common PDF extraction artifact: file path followed by prose suffix
     # e.g. src/nodes/justice.py-dependent
-    token = re.sub(r"(\.(?:py|md|json|ya?ml|txt))(?:-[a-z][\w-]*)+", r"\1", token)
+    token = _PATH_PROSE_SUFFIX_RE.sub(r"\1", token)
     # Common extraction artifact: two paths fused together (e.g. src/state.py/src/graph.py)
-    fused = re.match(r"^(.*\.(?:py|md|json|ya?ml|txt))(?:/src/.*)$", token)
+    fused = _FUSED_PATHS_RE.match(token)
     if fused:
         token = fused.group(1)
     while token and token[-1] in ".,;:)]}":
@@ -113,7 +154,11 @@ def _resolve_near_match(path: str, repo_files: set[str], repo_dirs: set[str]) ->
     return best[1] if best else None
 
 
-def protocol_citation_check(report_path: str | None, known_paths: list[str]) -> Evidence:
+def protocol_citation_check(
+    report_path: str | None,
+    known_paths: list[str],
+    chunks: Sequence[str] | None = None,
+) -> Evidence:
     if not report_path:
         return Evidence(
             id="doc.citation_check",
@@ -126,7 +171,8 @@ def protocol_citation_check(report_path: str | None, known_paths: list[str]) ->
         )
 
     path = Path(report_path)
-    if not path.exists():
+    # Pre-parsed chunks mean the caller already validated and ingested the report.
+    if chunks is None and not path.exists():
         return Evidence(
             id="doc.citation_check",
             goal="Cross-reference cited files against repository artifacts.",
@@ -137,9 +183,10 @@ def protocol_citation_check(report_path: str | None, known_paths: list[str]) ->
             tags=["docs", "hallucination"],
         )
 
-    chunks = ingest_pdf(str(path))
+    if chunks is None:
+        chunks = ingest_pdf(str(path))
     text = "\n".join(chunks)
-    cited_raw = set(re.findall(r"\b(?:src|tests|audit|reports)/[\w./-]+/?", text))
+    cited_raw = {m.group(0) for m in _CITED_PATH_RE.finditer(text)}
     cited_with_flags: list[tuple[str, bool]] = []
     for item in cited_raw:
         normalized = _normalize_cited_path(item)
@@ -188,8 +235,11 @@ def protocol_citation_check(report_path: str | None, known_paths: list[str]) ->
     )
 
 
-def protocol_concept_verification(report_path: str | None) -> Evidence:
-    if not report_path or not Path(report_path).exists():
+def protocol_concept_verification(
+    report_path: str | None,
+    chunks: Sequence[str] | None = None,
+) -> Evidence:
+    if not report_path or (chunks is None and not Path(report_path).exists()):
         return Evidence(
             id="doc.concept_verification",
             goal="Verify conceptual treatment of metacognition and dialectical synthesis.",
@@ -200,7 +250,8 @@ def protocol_concept_verification(report_path: str | None) -> Evidence:
             tags=["docs", "concept"],
         )
 
-    chunks = ingest_pdf(report_path)
+    if chunks is None:
+        chunks = ingest_pdf(report_path)
     hits = query_pdf_chunks(
         chunks,
         "Dialectical Synthesis Fan-In Fan-Out Metacognition State Synchronization",
@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 import subprocess
 import tempfile
+import threading
 from difflib import SequenceMatcher
 from pathlib import Path
 
@@ -13,20 +14,58 @@ def is_url(target: str) -> bool:
     return target.startswith("http://") or target.startswith("https://") or target.endswith(".git")
 
 
+# Remote clones are leased per graph run: while any lease on a URL is held, every protocol
+# resolving it reuses that checkout, and the last release removes it. Failed clones are not
+# cached, so the next run (or the next protocol) simply tries again.
+_CLONES: dict[str, list] = {}
+_CLONE_LOCK = threading.Lock()
+
+
+def _clone(target: str) -> tuple[Path, tempfile.TemporaryDirectory[str]]:
+    temp_dir = tempfile.TemporaryDirectory()
+    repo_path = Path(temp_dir.name) / "repo"
+    proc = subprocess.run(
+        ["git", "clone", "--depth", "200", target, str(repo_path)],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        temp_dir.cleanup()
+        raise RuntimeError((proc.stderr or proc.stdout or "git clone failed").strip())
+    return repo_path, temp_dir
+
+
+def acquire_repo(target: str) -> None:
+    if not is_url(target):
+        return
+    with _CLONE_LOCK:
+        entry = _CLONES.get(target)
+        if entry is None:
+            repo_path, temp_dir = _clone(target)
+            entry = _CLONES[target] = [repo_path, temp_dir, 0]
+        entry[2] += 1
+
+
+def release_repo(target: str) -> None:
+    with _CLONE_LOCK:
+        entry = _CLONES.get(target)
+        if entry is None:
+            return
+        entry[2] -= 1
+        if entry[2] == 0:
+            del _CLONES[target]
+            entry[1].cleanup()
+
+
 def resolve_repo(target: str) -> tuple[Path, tempfile.TemporaryDirectory[str] | None]:
     if is_url(target):
-        temp_dir = tempfile.TemporaryDirectory()
-        repo_path = Path(temp_dir.name) / "repo"
-        proc = subprocess.run(
-            ["git", "clone", "--depth", "200", target, str(repo_path)],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        if proc.returncode != 0:
-            temp_dir.cleanup()
-            raise RuntimeError((proc.stderr or proc.stdout or "git clone failed").strip())
-        return repo_path, temp_dir
+        with _CLONE_LOCK:
+            entry = _CLONES.get(target)
+        if entry is not None:
+            # The lease holder owns this checkout; the caller gets no temp dir to clean up.
+            return entry[0], None
+        return _clone(target)
     return Path(target).resolve(), None
 
 